@@ -6,6 +6,7 @@ Main application controller using GTK4 and libadwaita
 
 # Standard library imports
 import gettext
+import importlib.util
 import locale
 import os
 import warnings
@@ -21,6 +22,7 @@ from gi.repository import Gtk, Adw, Gio, Gdk, GLib
 # Local imports
 from core.config import Config
 from core.services import ProjectManager
+from ui.components import probe_spell_languages
 from ui.main_window import MainWindow
 from utils.i18n import _
 
@@ -32,12 +34,8 @@ except ImportError:
     ENCHANT_AVAILABLE = False
     enchant = None
 
-# Try to load PyGTKSpellcheck
-try:
-    import gtkspellcheck
-    SPELL_CHECK_AVAILABLE = True
-except ImportError:
-    SPELL_CHECK_AVAILABLE = False
+# Check for PyGTKSpellcheck without importing it (loaded lazily by the UI)
+SPELL_CHECK_AVAILABLE = importlib.util.find_spec('gtkspellcheck') is not None
 
 
 def setup_system_localization():
@@ -218,15 +216,9 @@ class TacApplication(Adw.Application):
             return
         
         try:
-            # Check for available dictionaries
-            available_dicts = []
-            for lang in ['pt_BR', 'en_US', 'en_GB', 'es_ES', 'fr_FR', 'de_DE', 'it_IT']:
-                try:
-                    if enchant.dict_exists(lang):
-                        available_dicts.append(lang)
-                except Exception as e:
-                    if os.environ.get('TAC_DEBUG'):
-                        print(_("Error checking dictionary {}: {}").format(lang, e))
+            # Check for available dictionaries; the probe is cached and
+            # shared with the editors' spell check helper
+            available_dicts = list(probe_spell_languages())
 
             if available_dicts:
                 if os.environ.get('TAC_DEBUG'):
@@ -447,6 +439,17 @@ class TacApplication(Adw.Application):
                 border: 1px solid alpha(@warning_color, 0.6);
             }
 
+            /* Project list row actions, shown only on hover or focus */
+            .row-actions {
+                opacity: 0;
+                transition: opacity 120ms ease;
+            }
+
+            row:hover .row-actions,
+            row:focus-within .row-actions {
+                opacity: 1;
+            }
+
             /* Footnote badge styles */
             .footnote-badge {
                 background: @accent_bg_color;
@@ -14,7 +14,7 @@ from datetime import datetime
 
 from .config import Config
 from .models import Project, Paragraph, ParagraphType
-from utils.helpers import FileHelper
+from utils.helpers import FileHelper, FormatHelper
 from utils.i18n import _
 
 # ODT export dependencies
@@ -44,6 +44,31 @@ except ImportError:
     IMAGE_PROCESSING_AVAILABLE = False
 
 
+# Bound once: list_projects calls these for every project and paragraph
+_fromisoformat = datetime.fromisoformat
+_format_datetime = FormatHelper.format_datetime
+_calculate_total_word_count = Project._calculate_total_word_count
+_count_logical_paragraphs = Project._count_logical_paragraphs
+
+
+class _LightParagraph:
+    """Paragraph type and content, enough to compute project statistics"""
+
+    __slots__ = ('type', 'content')
+
+    def __init__(self, p_type, content):
+        try:
+            self.type = ParagraphType(p_type)
+        except ValueError:
+            # Handle old 'argument_quote' -> 'quote' migration
+            if p_type == 'argument_quote':
+                self.type = ParagraphType.QUOTE
+            else:
+                # Skip invalid types
+                self.type = None
+        self.content = content or ''
+
+
 class ProjectManager:
     """Manages project operations using a SQLite database"""
     
@@ -51,6 +76,9 @@ class ProjectManager:
         self.config = Config()
         self.db_path = self.config.database_path
         self._migration_lock = threading.Lock()
+
+        # Last list_projects result, keyed by the database files' state
+        self._projects_cache = None
         self._init_db()
         self._run_migration_if_needed()
         
@@ -282,6 +310,8 @@ class ProjectManager:
         """Save project to the database (UPSERT)"""
         if is_migration:
             return True
+
+        self._projects_cache = None
         
         # Create database backup before saving
         self._create_database_backup()
@@ -404,8 +434,24 @@ class ProjectManager:
         # Fallback: use data directory
         return self.config.data_dir
 
+    def _database_state(self) -> tuple:
+        """Modification time and size of the database and its WAL file"""
+        state = []
+        for path in (self.db_path, self.db_path.with_name(self.db_path.name + '-wal')):
+            try:
+                stat = path.stat()
+                state.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                state.append(None)
+        return tuple(state)
+
     def list_projects(self) -> List[Dict[str, Any]]:
         """List all projects from the database with optimized statistics"""
+        # Reuse the last listing while the database files are untouched
+        state = self._database_state()
+        if self._projects_cache is not None and self._projects_cache[0] == state:
+            return [dict(info) for info in self._projects_cache[1]]
+
         projects_info = []
         try:
             with self._get_db_connection() as conn:
@@ -432,44 +478,41 @@ class ProjectManager:
                     # Convert database rows to lightweight paragraph objects for calculation
                     paragraph_data = []
                     for p_row in paragraphs_rows:
-                        # Create a simple object with the attributes needed for statistics
-                        class LightParagraph:
-                            def __init__(self, p_type, content):
-                                try:
-                                    self.type = ParagraphType(p_type)
-                                except ValueError:
-                                    # Handle old 'argument_quote' -> 'quote' migration
-                                    if p_type == 'argument_quote':
-                                        self.type = ParagraphType.QUOTE
-                                    else:
-                                        # Skip invalid types
-                                        self.type = None
-                                self.content = content or ''
-                        
-                        light_p = LightParagraph(p_row['type'], p_row['content'])
+                        light_p = _LightParagraph(p_row['type'], p_row['content'])
                         if light_p.type is not None:
                             paragraph_data.append(light_p)
                     
                     # Use consolidated static methods from Project class
-                    total_words = sum(
-                        Project._calculate_word_count(p.content) 
-                        for p in paragraph_data
+                    total_words = _calculate_total_word_count(
+                        [p.content for p in paragraph_data]
                     )
-                    total_paragraphs = Project._count_logical_paragraphs(paragraph_data)
+                    total_paragraphs = _count_logical_paragraphs(paragraph_data)
                     
                     stats = {
                         'total_paragraphs': total_paragraphs,
                         'total_words': total_words,
                     }
                     
+                    # Format the modification date once for list display
+                    modified_str_short = ''
+                    if project_row['modified_at']:
+                        try:
+                            modified_dt = _fromisoformat(project_row['modified_at'])
+                            modified_str_short = _format_datetime(modified_dt, 'short')
+                        except (ValueError, TypeError):
+                            pass
+
                     projects_info.append({
                         'id': project_row['id'],
                         'name': project_row['name'],
                         'created_at': project_row['created_at'],
                         'modified_at': project_row['modified_at'],
                         'statistics': stats,
-                        'file_path': None
+                        'file_path': None,
+                        '_modified_str_short': modified_str_short
                     })
+
+            self._projects_cache = (state, [dict(info) for info in projects_info])
                     
         except sqlite3.Error as e:
             print(_("Database error listing projects: {}").format(e))
@@ -642,6 +685,7 @@ class ProjectManager:
 
     def delete_project(self, project_id: str) -> bool:
         """Delete project from the database"""
+        self._projects_cache = None
         try:
             with self._get_db_connection() as conn:
                 cursor = conn.cursor()
@@ -764,6 +808,8 @@ class ProjectManager:
 
     def import_database(self, backup_path: Path) -> bool:
         """Import database from backup file"""
+        # copy2 keeps the backup's mtime, so the file state alone can't tell
+        self._projects_cache = None
         try:
             # Validate backup file
             if not self._validate_backup_file(backup_path):
@@ -19,8 +19,11 @@ warnings.filterwarnings("ignore", category=DeprecationWarning)
 os.environ.setdefault('G_MESSAGES_DEBUG', '')
 os.environ.setdefault('MESA_GLTHREAD', 'false')
 
-# Suppress libenchant broker warnings
+# Log warnings and above by default; debug output stays off
 import logging
+logging.basicConfig(level=logging.WARNING)
+
+# Suppress libenchant broker warnings
 enchant_logger = logging.getLogger('enchant.broker')
 enchant_logger.setLevel(logging.ERROR)
 
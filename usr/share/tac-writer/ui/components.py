@@ -7,27 +7,97 @@ import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 
-from gi.repository import Gtk, Adw, GObject, Gdk, GLib, Pango, Graphene
+from gi.repository import Gtk, Adw, GObject, Gdk, Gio, GLib, Pango, Graphene
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+import itertools
+import json
+import logging
+import os
+import sys
+import threading
+import weakref
 
 from core.models import Paragraph, ParagraphType, DEFAULT_TEMPLATES
 from core.services import ProjectManager
 from utils.helpers import TextHelper, FormatHelper
 from utils.i18n import _
 
-# Try to load PyGTKSpellcheck
-try:
-    import gtkspellcheck
-    SPELL_CHECK_AVAILABLE = True
-    print("PyGTKSpellcheck available - spell checking enabled")
-except ImportError:
-    SPELL_CHECK_AVAILABLE = False
-    print("PyGTKSpellcheck not available - spell checking disabled")
+logger = logging.getLogger(__name__)
+
+# PyGTKSpellcheck is imported lazily on first use (None = not probed yet)
+SPELL_CHECK_AVAILABLE = None
+gtkspellcheck = None
+
+
+def _ensure_spell_module() -> bool:
+    """Import PyGTKSpellcheck on first use and cache the result"""
+    global SPELL_CHECK_AVAILABLE, gtkspellcheck
+
+    if SPELL_CHECK_AVAILABLE is None:
+        try:
+            import gtkspellcheck as spell_module
+            gtkspellcheck = spell_module
+            SPELL_CHECK_AVAILABLE = True
+            logger.debug("PyGTKSpellcheck available - spell checking enabled")
+        except ImportError:
+            SPELL_CHECK_AVAILABLE = False
+            logger.debug("PyGTKSpellcheck not available - spell checking disabled")
+
+    return SPELL_CHECK_AVAILABLE
 
 # Global CSS provider cache
 _css_cache = {}
 
 
+# Delay before buffered text edits are applied, in milliseconds
+_TEXT_CHANGE_DELAY_MS = 250
+
+# Delay before the project list is filtered by what was typed
+_SEARCH_FILTER_DELAY_MS = 120
+
+# Projects added to the list per main loop iteration while refreshing
+_PROJECT_LOAD_CHUNK = 50
+
+# Drag payload format for paragraph reordering (ASCII paragraph id)
+_PARAGRAPH_DRAG_MIME = "application/x-tac-paragraph-id"
+
+# CSS classes marking the dragged paragraph and the one under the pointer
+_CSS_DRAGGING = "dragging"
+_CSS_DROP_TARGET = "drop-target"
+
+# Height limits of a paragraph's scrolled text area, in pixels
+_TEXT_AREA_MIN_HEIGHT = 100
+_TEXT_AREA_MAX_HEIGHT = 300
+
+# Vertical margins of a paragraph text view, inside its text area
+_TEXT_VIEW_MARGIN_TOP = 8
+_TEXT_VIEW_MARGIN_BOTTOM = 12
+
+# Rough text metrics at 12 pt, used to size deferred text areas
+_ESTIMATE_CHARS_PER_LINE = 90
+_ESTIMATE_LINE_HEIGHT = 22
+
+# Welcome view markup, built on first use once translations are configured
+_welcome_markup = None
+
+
+def _get_welcome_markup() -> dict:
+    """Get cached markup strings for the welcome view"""
+    global _welcome_markup
+
+    if _welcome_markup is None:
+        _welcome_markup = {
+            'title': f"<span size='x-large' weight='bold'>{_('Welcome to TAC')}</span>",
+            'subtitle': f"<span size='medium'>{_('Continuous Argumentation Technique')}</span>",
+            'note': "<span size='small'><i>" + _("Note:") + " " + _("exporting to ODT might require some adjustment in your Office Suite.") + "</i></span>",
+        }
+
+    return _welcome_markup
+
+
 def get_cached_css_provider(font_family: str, font_size: int) -> dict:
     """Get or create cached CSS provider"""
     key = f"{font_family}_{font_size}"
@@ -50,6 +120,15 @@ def get_cached_css_provider(font_family: str, font_size: int) -> dict:
     return _css_cache[key]
 
 
+def _get_boot_id() -> str:
+    """Identifier of the current boot, '' where unavailable"""
+    try:
+        with open('/proc/sys/kernel/random/boot_id', 'r', encoding='ascii') as f:
+            return f.read().strip()
+    except OSError:
+        return ''
+
+
 class PomodoroTimer(GObject.Object):
     """Pomodoro Timer to help with focus during writing sessions"""
     
@@ -60,14 +139,24 @@ class PomodoroTimer(GObject.Object):
         'session-changed': (GObject.SIGNAL_RUN_FIRST, None, (int, str)),
     }
 
-    def __init__(self, **kwargs):
+    def __init__(self, state_file=None, **kwargs):
         super().__init__(**kwargs)
+
+        # JSON file the timer state is saved to, if any
+        self.state_file = state_file
         
         # Timer state
         self.current_session = 1
         self.is_running = False
         self.is_work_time = True
         self.timer_id = None
+
+        # Monotonic start of the running countdown and the time left then
+        self._start_monotonic = 0
+        self._duration_at_start = 0
+
+        # Weak reference to the dialog notified directly on state changes
+        self._observer = None
         
         # Duration in seconds
         self.work_duration = 25 * 60
@@ -78,11 +167,25 @@ class PomodoroTimer(GObject.Object):
         # Current remaining time
         self.time_remaining = self.work_duration
 
+        # Every "MM:SS" string the countdown can show, indexed by seconds
+        longest = max(self.work_duration, self.short_break_duration, self.long_break_duration)
+        self._time_strings = tuple(f"{s // 60:02d}:{s % 60:02d}" for s in range(longest + 1))
+
+        # Session titles, translated once
+        self._session_titles = {
+            'work': _("Session {}"),
+            'long_break': _("Long Break"),
+            'short_break': _("Rest Time"),
+        }
+
+        self._restore_state()
+
     def start_timer(self):
         """Start the timer"""
         if not self.is_running:
             self.is_running = True
             self._start_countdown()
+            self._save_state()
 
     def stop_timer(self):
         """Stop the timer"""
@@ -91,6 +194,7 @@ class PomodoroTimer(GObject.Object):
             if self.timer_id:
                 GLib.source_remove(self.timer_id)
                 self.timer_id = None
+            self._save_state()
 
     def reset_timer(self):
         """Reset the timer to initial state"""
@@ -98,24 +202,41 @@ class PomodoroTimer(GObject.Object):
         self.current_session = 1
         self.is_work_time = True
         self.time_remaining = self.work_duration
+        self._save_state()
         self.emit('session-changed', self.current_session, 'work')
+        self._notify_observer('session', 'work')
 
     def _start_countdown(self):
         """Start the countdown"""
         if self.timer_id:
             GLib.source_remove(self.timer_id)
-        
-        self.timer_id = GLib.timeout_add(1000, self._countdown_tick)
+
+        # Remaining time is derived from the clock, so late wakeups never drift
+        self._start_monotonic = GLib.get_monotonic_time()
+        self._duration_at_start = self.time_remaining
+        self._schedule_ticks()
+
+    def _schedule_ticks(self):
+        """Run _countdown_tick once per second"""
+        # Whole-second timer, which GLib may batch with other wakeups
+        self.timer_id = GLib.timeout_add_seconds(1, self._countdown_tick)
 
     def _countdown_tick(self):
         """Execute every second of countdown"""
         if not self.is_running:
             return False
-            
-        self.time_remaining -= 1
+
+        elapsed = (GLib.get_monotonic_time() - self._start_monotonic) // 1_000_000
+        time_remaining = max(0, self._duration_at_start - elapsed)
+        if time_remaining == self.time_remaining:
+            return True
+
+        self.time_remaining = time_remaining
         self.emit('timer-tick', self.time_remaining)
+        self._notify_observer('tick', self.time_remaining)
         
         if self.time_remaining <= 0:
+            self.timer_id = None
             self._timer_finished()
             return False
             
@@ -124,36 +245,128 @@ class PomodoroTimer(GObject.Object):
     def _timer_finished(self):
         """Called when timer finishes"""
         self.is_running = False
-        
+
+        finished = 'work' if self.is_work_time else 'break'
+        self.emit('timer-finished', finished)
+        self._notify_observer('finished', finished)
+
+        self._advance_period()
+        self._save_state()
+
+        period = 'work' if self.is_work_time else 'break'
+        self.emit('session-changed', self.current_session, period)
+        self._notify_observer('session', period)
+
+    def _advance_period(self):
+        """Move on to the period that follows the current one"""
         if self.is_work_time:
             # Work period finished, start break
-            self.emit('timer-finished', 'work')
             self.is_work_time = False
-            
-            # Determine break duration
             if self.current_session >= self.max_sessions:
                 self.time_remaining = self.long_break_duration
             else:
                 self.time_remaining = self.short_break_duration
-                
-            self.emit('session-changed', self.current_session, 'break')
-            
+        elif self.current_session >= self.max_sessions:
+            # Completed all sessions
+            self.current_session = 1
+            self.is_work_time = True
+            self.time_remaining = self.work_duration
         else:
-            # Break period finished
-            self.emit('timer-finished', 'break')
-            
-            if self.current_session >= self.max_sessions:
-                # Completed all sessions
-                self.reset_timer()
-            else:
-                # Next work session
-                self.current_session += 1
-                self.is_work_time = True
-                self.time_remaining = self.work_duration
-                self.emit('session-changed', self.current_session, 'work')
+            # Next work session
+            self.current_session += 1
+            self.is_work_time = True
+            self.time_remaining = self.work_duration
+
+    def _save_state(self):
+        """Write the timer state to the state file, atomically"""
+        if not self.state_file:
+            return
+
+        state = {
+            'session': self.current_session,
+            'is_work': self.is_work_time,
+            'running': self.is_running,
+            'time_remaining': self.time_remaining,
+            'monotonic_start_us': self._start_monotonic,
+            'duration': self._duration_at_start,
+            'boot_id': _get_boot_id(),
+        }
+        temp_path = self.state_file.with_name(self.state_file.name + '.tmp')
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+            os.replace(temp_path, self.state_file)
+        except OSError as e:
+            logger.warning("Could not save Pomodoro state: %s", e)
+
+    def _restore_state(self):
+        """Restore the state saved by a previous run, resuming if possible"""
+        if not self.state_file:
+            return
+
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            session = int(state['session'])
+            is_work = bool(state['is_work'])
+            time_remaining = int(state['time_remaining'])
+            running = bool(state.get('running'))
+            start = int(state.get('monotonic_start_us', 0))
+            duration = int(state.get('duration', 0))
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            logger.warning("Could not restore Pomodoro state: %s", e)
+            return
+
+        self.current_session = max(1, min(session, self.max_sessions))
+        self.is_work_time = is_work
+        period = self.get_session_info()['type']
+        full_duration = {
+            'work': self.work_duration,
+            'short_break': self.short_break_duration,
+            'long_break': self.long_break_duration,
+        }[period]
+
+        if not running:
+            # Paused: pick up where it stopped
+            self.time_remaining = max(1, min(time_remaining, full_duration))
+            return
+
+        # The monotonic clock only carries over within the same boot;
+        # otherwise only the session count survives
+        boot_id = _get_boot_id()
+        if not boot_id or state.get('boot_id') != boot_id:
+            self.time_remaining = full_duration
+            return
+
+        elapsed = (GLib.get_monotonic_time() - start) // 1_000_000
+        duration = min(duration, full_duration)
+        if elapsed < 0 or duration <= 0:
+            self.time_remaining = full_duration
+        elif elapsed < duration:
+            self._start_monotonic = start
+            self._duration_at_start = duration
+            self.time_remaining = duration - elapsed
+            self.is_running = True
+            self._schedule_ticks()
+        else:
+            # The period ran out while the app was closed: move on, paused,
+            # as the finished countdown would have
+            self._advance_period()
+            self._save_state()
+
+    def _notify_observer(self, kind, value):
+        """Notify the attached dialog directly, bypassing signal dispatch"""
+        observer = self._observer() if self._observer else None
+        if observer is not None:
+            observer._on_state_changed(kind, value)
 
     def get_time_string(self):
         """Return formatted time as MM:SS string"""
+        if 0 <= self.time_remaining < len(self._time_strings):
+            return self._time_strings[self.time_remaining]
+
         minutes = self.time_remaining // 60
         seconds = self.time_remaining % 60
         return f"{minutes:02d}:{seconds:02d}"
@@ -161,24 +374,110 @@ class PomodoroTimer(GObject.Object):
     def get_session_info(self):
         """Return current session information"""
         if self.is_work_time:
-            return {
-                'title': _("Session {}").format(self.current_session),
-                'type': 'work',
-                'session': self.current_session
-            }
+            session_type = 'work'
+        elif self.current_session >= self.max_sessions:
+            session_type = 'long_break'
         else:
-            if self.current_session >= self.max_sessions:
-                return {
-                    'title': _("Long Break"),
-                    'type': 'long_break',
-                    'session': self.current_session
-                }
-            else:
-                return {
-                    'title': _("Rest Time"),
-                    'type': 'short_break',
-                    'session': self.current_session
-                }
+            session_type = 'short_break'
+
+        title = self._session_titles[session_type]
+        if session_type == 'work':
+            title = title.format(self.current_session)
+
+        return {
+            'title': title,
+            'type': session_type,
+            'session': self.current_session
+        }
+
+
+# Pomodoro dialog layout: header with minimize button, then the session
+# title, time display and control buttons
+_POMODORO_UI_XML = """
+<interface>
+  <object class="GtkBox" id="main_box">
+    <property name="orientation">vertical</property>
+    <child>
+      <object class="GtkBox">
+        <property name="height-request">50</property>
+        <property name="margin-start">20</property>
+        <property name="margin-end">15</property>
+        <property name="margin-top">15</property>
+        <style><class name="header-area"/></style>
+        <child>
+          <object class="GtkBox">
+            <property name="hexpand">true</property>
+          </object>
+        </child>
+        <child>
+          <object class="GtkButton" id="minimize_button">
+            <property name="icon-name">window-minimize-symbolic</property>
+            <property name="width-request">30</property>
+            <property name="height-request">30</property>
+            <property name="hexpand">false</property>
+            <property name="vexpand">false</property>
+            <property name="halign">center</property>
+            <property name="valign">center</property>
+            <style><class name="flat"/><class name="circular"/></style>
+          </object>
+        </child>
+      </object>
+    </child>
+    <child>
+      <object class="GtkBox">
+        <property name="orientation">vertical</property>
+        <property name="spacing">30</property>
+        <property name="margin-start">40</property>
+        <property name="margin-end">40</property>
+        <property name="margin-top">10</property>
+        <property name="margin-bottom">40</property>
+        <property name="vexpand">true</property>
+        <property name="valign">center</property>
+        <child>
+          <object class="GtkLabel" id="session_label">
+            <property name="halign">center</property>
+            <style><class name="title-2"/></style>
+          </object>
+        </child>
+        <child>
+          <object class="GtkBox">
+            <property name="orientation">vertical</property>
+            <property name="spacing">5</property>
+            <property name="halign">center</property>
+            <child>
+              <object class="GtkLabel" id="time_label">
+                <property name="halign">center</property>
+                <style><class name="timer-display"/></style>
+              </object>
+            </child>
+          </object>
+        </child>
+        <child>
+          <object class="GtkBox">
+            <property name="spacing">15</property>
+            <property name="halign">center</property>
+            <property name="margin-top">10</property>
+            <child>
+              <object class="GtkButton" id="start_stop_button">
+                <property name="width-request">120</property>
+                <property name="height-request">45</property>
+                <style><class name="pill"/><class name="suggested-action"/></style>
+              </object>
+            </child>
+            <child>
+              <object class="GtkButton" id="reset_button">
+                <property name="width-request">100</property>
+                <property name="height-request">45</property>
+                <style><class name="pill"/><class name="destructive-action"/></style>
+              </object>
+            </child>
+          </object>
+        </child>
+      </object>
+    </child>
+  </object>
+</interface>
+"""
 
 
 class PomodoroDialog(Adw.Window):
@@ -194,11 +493,18 @@ class PomodoroDialog(Adw.Window):
         
         self.timer = timer
         self.parent_window = parent
+
+        # Pending idle display refresh; one at most however many changes arrive
+        self._display_update_id = None
+
+        # Set when a refresh was skipped because the dialog was hidden
+        self._display_dirty = False
+
+        # Whether the time label currently carries the break style
+        self._break_style = False
         
-        # Connect timer signals
-        self.timer.connect('timer-tick', self._on_timer_tick)
-        self.timer.connect('timer-finished', self._on_timer_finished)
-        self.timer.connect('session-changed', self._on_session_changed)
+        # Receive timer updates by direct call instead of signals
+        self.timer._observer = weakref.ref(self)
         
         self._setup_ui()
         self._setup_styles()
@@ -209,90 +515,25 @@ class PomodoroDialog(Adw.Window):
     
     def _setup_ui(self):
         """Setup user interface with improved design"""
-        main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=0)
-        
-        # Custom header with minimize button
-        header_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
-        header_box.set_size_request(-1, 50)
-        header_box.set_margin_start(20)
-        header_box.set_margin_end(15)
-        header_box.set_margin_top(15)
-        header_box.add_css_class("header-area")
-        
-        # Spacer to push button to right
-        header_spacer = Gtk.Box()
-        header_spacer.set_hexpand(True)
-        header_box.append(header_spacer)
-        
-        # Minimize button in top right corner
-        self.minimize_button = Gtk.Button()
-        self.minimize_button.set_icon_name('window-minimize-symbolic')
+        # All widget properties are applied by the builder in C
+        builder = Gtk.Builder.new_from_string(_POMODORO_UI_XML, -1)
+
+        self.session_label = builder.get_object('session_label')
+        self.time_label = builder.get_object('time_label')
+        self.start_stop_button = builder.get_object('start_stop_button')
+        self.reset_button = builder.get_object('reset_button')
+        self.minimize_button = builder.get_object('minimize_button')
+
+        # Translatable text goes through the application's gettext setup
         self.minimize_button.set_tooltip_text(_("Minimize"))
-        self.minimize_button.add_css_class("flat")
-        self.minimize_button.add_css_class("circular")
-        self.minimize_button.set_size_request(30, 30)
-        self.minimize_button.set_hexpand(False)
-        self.minimize_button.set_vexpand(False)
-        self.minimize_button.set_halign(Gtk.Align.CENTER)
-        self.minimize_button.set_valign(Gtk.Align.CENTER)
+        self.reset_button.set_label(_("Reset"))
+
         self.minimize_button.connect('clicked', self._on_minimize_clicked)
-        header_box.append(self.minimize_button)
-        
-        main_box.append(header_box)
-        
-        # Main content area
-        content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=30)
-        content_box.set_margin_start(40)
-        content_box.set_margin_end(40)
-        content_box.set_margin_top(10)
-        content_box.set_margin_bottom(40)
-        content_box.set_vexpand(True)
-        content_box.set_valign(Gtk.Align.CENTER)
-        
-        # Session title header
-        self.session_label = Gtk.Label()
-        self.session_label.add_css_class('title-2')
-        self.session_label.set_halign(Gtk.Align.CENTER)
-        content_box.append(self.session_label)
-        
-        # Time display with enhanced styling
-        time_container = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
-        time_container.set_halign(Gtk.Align.CENTER)
-        
-        self.time_label = Gtk.Label()
-        self.time_label.add_css_class('timer-display')
-        self.time_label.set_halign(Gtk.Align.CENTER)
-        time_container.append(self.time_label)
-        
-        content_box.append(time_container)
-        
-        # Control buttons with circular design
-        button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=15)
-        button_box.set_halign(Gtk.Align.CENTER)
-        button_box.set_margin_top(10)
-        
-        # Start/Stop button with circular design
-        self.start_stop_button = Gtk.Button()
-        self.start_stop_button.add_css_class('pill')
-        self.start_stop_button.add_css_class('suggested-action')
-        self.start_stop_button.set_size_request(120, 45)
         self.start_stop_button.connect('clicked', self._on_start_stop_clicked)
-        button_box.append(self.start_stop_button)
-        
-        # Reset button with circular design
-        self.reset_button = Gtk.Button(label=_("Reset"))
-        self.reset_button.add_css_class('pill')
-        self.reset_button.add_css_class('destructive-action')
-        self.reset_button.set_size_request(100, 45)
         self.reset_button.connect('clicked', self._on_reset_clicked)
-        button_box.append(self.reset_button)
-        
-        content_box.append(button_box)
-        
-        main_box.append(content_box)
         
         # Add to window
-        self.set_content(main_box)
+        self.set_content(builder.get_object('main_box'))
         
         # Update initial button state
         self._update_buttons()
@@ -306,9 +547,14 @@ class PomodoroDialog(Adw.Window):
                 font-size: 72px;
                 font-weight: bold;
                 font-family: 'SF Mono', 'Monaco', 'Inconsolata', 'Fira Code', monospace;
+                font-feature-settings: "tnum";
                 color: @accent_color;
                 text-shadow: 0 2px 4px rgba(0,0,0,0.1);
             }
+
+            .timer-display.timer-break {
+                color: @success_color;
+            }
             
             .header-area {
                 background: transparent;
@@ -359,7 +605,7 @@ class PomodoroDialog(Adw.Window):
                 Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
             )
         except Exception as e:
-            print(_("Error setting up Pomodoro dialog styles: {}").format(e))
+            logger.warning("Error setting up Pomodoro dialog styles: %s", e)
     
     def _update_display(self):
         """Update dialog display with current timer information"""
@@ -369,19 +615,46 @@ class PomodoroDialog(Adw.Window):
         self.session_label.set_text(session_info['title'])
         self.time_label.set_text(time_str)
     
+    def _schedule_display_update(self):
+        """Schedule a display update unless one is already pending"""
+        if self._display_update_id is None:
+            self._display_update_id = GLib.idle_add(
+                self._force_display_update, priority=GLib.PRIORITY_DEFAULT_IDLE
+            )
+
+    def _cancel_display_update(self):
+        """Drop a pending display update that is about to be superseded"""
+        if self._display_update_id is not None:
+            GLib.source_remove(self._display_update_id)
+            self._display_update_id = None
+
     def _force_display_update(self):
         """Force complete display update"""
+        self._display_update_id = None
+
+        # Nobody can see it; refresh when the dialog is shown again
+        if not self.get_visible():
+            self._display_dirty = True
+            return False
+        self._display_dirty = False
+
         session_info = self.timer.get_session_info()
         time_str = self.timer.get_time_string()
         
-        # Update labels directly
+        # set_text already queues the needed redraw
         self.session_label.set_text(session_info['title'])
         self.time_label.set_text(time_str)
-        
-        # Force interface redraw
-        self.session_label.queue_draw()
-        self.time_label.queue_draw()
-        self.queue_draw()
+
+        # Only touch the style classes on work/break transitions
+        is_break = session_info['type'] != 'work'
+        if is_break != self._break_style:
+            self._break_style = is_break
+            if is_break:
+                self.time_label.add_css_class('timer-break')
+            else:
+                self.time_label.remove_css_class('timer-break')
+
+        self._update_buttons()
         
         return False
     
@@ -396,29 +669,43 @@ class PomodoroDialog(Adw.Window):
             self.start_stop_button.remove_css_class('destructive-action')
             self.start_stop_button.add_css_class('suggested-action')
     
+    def _on_state_changed(self, kind, value):
+        """Dispatch a state change notified by the timer"""
+        if kind == 'tick':
+            self._on_timer_tick(self.timer, value)
+        elif kind == 'finished':
+            self._on_timer_finished(self.timer, value)
+        elif kind == 'session':
+            self._on_session_changed(self.timer, self.timer.current_session, value)
+
     def _on_timer_tick(self, timer, time_remaining):
         """Update only time during execution"""
+        # Nothing to draw while minimized; show_dialog refreshes on return
+        if not self.get_visible():
+            return
+
+        # Plain text on fixed-width digits avoids markup parsing and reflow
         if time_remaining > 0:
             time_str = self.timer.get_time_string()
             self.time_label.set_text(time_str)
     
     def _on_timer_finished(self, timer, timer_type):
         """Handle timer finished - show window again"""
-        GLib.idle_add(self._force_display_update)
+        self._schedule_display_update()
         GLib.idle_add(self._show_timer_finished, timer_type)
     
     def _on_session_changed(self, timer, session, session_type):
         """Handle session change"""
-        GLib.idle_add(self._force_display_update)
-        GLib.idle_add(self._update_buttons)
+        self._schedule_display_update()
     
     def _show_timer_finished(self, timer_type):
         """Show window when timer finishes"""
-        self._force_display_update()
-        self._update_buttons()
-        
         # Show the window
         self.present()
+
+        # Catch up on a refresh skipped while hidden
+        if self._display_dirty:
+            self._force_display_update()
         
         # Add visual effect
         self._add_finish_animation()
@@ -451,9 +738,8 @@ class PomodoroDialog(Adw.Window):
     
     def _on_reset_clicked(self, button):
         """Handle Reset button"""
+        # reset_timer reports a session change, which schedules the refresh
         self.timer.reset_timer()
-        self._force_display_update()
-        self._update_buttons()
     
     def _on_minimize_clicked(self, button):
         """Handle Minimize button"""
@@ -466,71 +752,319 @@ class PomodoroDialog(Adw.Window):
     
     def show_dialog(self):
         """Show the dialog"""
-        self._force_display_update()
-        self._update_buttons()
+        # Present first: updates are skipped while the dialog is hidden
+        self._cancel_display_update()
         self.present()
+        self._force_display_update()
+
+
+# Single worker loading spell check dictionaries off the main loop into one
+# enchant broker shared with every checker. Brokers are not thread-safe, so
+# every broker call made here, on either thread, holds _enchant_lock
+_spell_executor = None
+_enchant_lock = threading.Lock()
+_shared_broker = None
+
+# Loaded dictionaries by language, only touched on the main loop. The broker
+# hands out its cached dictionary while one is alive, so holding these makes
+# checkers created on _shared_broker reuse them instead of loading again
+_loaded_dictionaries = {}
+_dictionary_callbacks = {}
+
+
+def _load_dictionary(language: str):
+    """Request a dictionary from the shared broker (worker thread)"""
+    global _shared_broker
+    import enchant
+    with _enchant_lock:
+        if _shared_broker is None:
+            _shared_broker = enchant.Broker()
+        return _shared_broker.request_dict(language)
+
+
+class _SharedBrokerEnchant:
+    """Stand-in for the enchant module whose Broker() is the shared broker"""
+
+    def __init__(self, broker):
+        self._broker = broker
+
+    def Broker(self, *args, **kwargs):
+        return self._broker
+
+    def __getattr__(self, name):
+        import enchant
+        return getattr(enchant, name)
+
+
+def _create_spell_checker(text_view, language):
+    """Create a gtkspellcheck checker that uses the shared broker"""
+    # SpellChecker builds its own enchant.Broker() and requests the
+    # dictionary from it, with no way to pass one in; swap the module's
+    # enchant reference only while the checker is constructed
+    spell_module = sys.modules.get(gtkspellcheck.SpellChecker.__module__)
+    real_enchant = getattr(spell_module, 'enchant', None)
+
+    with _enchant_lock:
+        if _shared_broker is None or real_enchant is None:
+            return gtkspellcheck.SpellChecker(text_view, language=language)
+
+        spell_module.enchant = _SharedBrokerEnchant(_shared_broker)
+        try:
+            return gtkspellcheck.SpellChecker(text_view, language=language)
+        finally:
+            spell_module.enchant = real_enchant
+
+
+def _on_dictionary_loaded(language: str, future):
+    """Store a dictionary loaded by the worker and run its waiting callbacks"""
+    try:
+        _loaded_dictionaries[language] = future.result()
+    except Exception as e:
+        logger.warning("Could not load spell check dictionary %s: %s", language, e)
+
+    for callback in _dictionary_callbacks.pop(language, ()):
+        callback()
+    return False
+
+
+@lru_cache(maxsize=1)
+def probe_spell_languages() -> tuple:
+    """Probe enchant once for the supported spell check dictionaries"""
+    try:
+        import enchant
+        languages = []
+        with _enchant_lock:
+            for lang in ['pt_BR', 'en_US', 'en_GB', 'es_ES', 'fr_FR', 'de_DE', 'it_IT']:
+                try:
+                    if enchant.dict_exists(lang):
+                        languages.append(lang)
+                except Exception as e:
+                    logger.debug("Error checking dictionary %s: %s", lang, e)
+        return tuple(languages)
+
+    except ImportError as e:
+        logger.warning("Enchant not available for spell checking: %s", e)
+        return ('pt_BR', 'en_US', 'es_ES', 'fr_FR', 'de_DE')
+
+
+def _get_edit_neighbors(start, end):
+    """Get the characters just outside an edit range ('' at buffer edges)"""
+    before = ''
+    if not start.is_start():
+        prev_iter = start.copy()
+        prev_iter.backward_char()
+        before = prev_iter.get_char()
+
+    after = '' if end.is_end() else end.get_char()
+    return before, after
+
+
+def _inserted_word_delta(location, text) -> int:
+    """Word count change caused by inserting text at location"""
+    # Only word boundaries next to the edit can change
+    before, after = _get_edit_neighbors(location, location)
+    return (TextHelper.count_words(before + text + after)
+            - TextHelper.count_words(before + after))
+
+
+def _deleted_word_delta(buffer, start, end) -> int:
+    """Word count change caused by deleting the range start..end"""
+    deleted = buffer.get_text(start, end, False)
+    before, after = _get_edit_neighbors(start, end)
+    return (TextHelper.count_words(before + after)
+            - TextHelper.count_words(before + deleted + after))
+
+
+class _CachedDictionary:
+    """Enchant dictionary proxy caching suggest() results per word"""
+
+    def __init__(self, dictionary, cache: OrderedDict, maxsize: int = 4096):
+        self._dictionary = dictionary
+        self._cache = cache
+        self._maxsize = maxsize
+        # Hot path, bound directly to skip __getattr__
+        self.check = dictionary.check
+
+    def suggest(self, word):
+        """Return suggestions for a word, reusing earlier results"""
+        key = (getattr(self._dictionary, 'tag', None), word)
+        suggestions = self._cache.get(key)
+        if suggestions is None:
+            suggestions = tuple(self._dictionary.suggest(word))
+            self._cache[key] = suggestions
+            if len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        return list(suggestions)
+
+    def _invalidate(self, method_name, word):
+        """Forward a word list change and drop cached suggestions"""
+        self._cache.clear()
+        return getattr(self._dictionary, method_name)(word)
+
+    def add(self, word):
+        return self._invalidate('add', word)
+
+    def add_to_pwl(self, word):
+        return self._invalidate('add_to_pwl', word)
+
+    def add_to_session(self, word):
+        return self._invalidate('add_to_session', word)
+
+    def remove(self, word):
+        return self._invalidate('remove', word)
+
+    def remove_from_session(self, word):
+        return self._invalidate('remove_from_session', word)
+
+    def __getattr__(self, name):
+        return getattr(self._dictionary, name)
 
 
 class SpellCheckHelper:
     """Helper class for spell checking functionality using PyGTKSpellcheck"""
 
+    # Shared helper instances, one per configuration object
+    _shared_helpers = {}
+
+    @classmethod
+    def get_shared(cls, config):
+        """Get the helper shared by all editors using this configuration"""
+        helper = cls._shared_helpers.get(id(config))
+        if helper is None or helper.config is not config:
+            helper = cls(config)
+            cls._shared_helpers[id(config)] = helper
+        return helper
+
     def __init__(self, config=None):
         self.config = config
         self.available_languages = []
-        self.spell_checkers = {}
+        self.spell_checkers = weakref.WeakKeyDictionary()
+        self._suggestion_cache = OrderedDict()
+        # One cached dictionary proxy per language, shared by all checkers
+        self._cached_dictionaries = {}
+
+        # Spell checker attaches waiting for the main loop, one per owner
+        self._attach_queue = OrderedDict()
+        self._attach_source_id = None
+
         self._load_available_languages()
 
     def _load_available_languages(self):
         """Load available spell check languages"""
-        if not SPELL_CHECK_AVAILABLE:
+        if not _ensure_spell_module():
             return
 
-        try:
-            import enchant
-            self.available_languages = []
-            for lang in ['pt_BR', 'en_US', 'en_GB', 'es_ES', 'fr_FR', 'de_DE', 'it_IT']:
-                try:
-                    if enchant.dict_exists(lang):
-                        self.available_languages.append(lang)
-                except Exception as e:
-                    print(_("Error checking dictionary {}: {}").format(lang, e))
+        self.available_languages = list(probe_spell_languages())
+
+    def _get_spell_language(self, language=None) -> str:
+        """Get the language to spell check with"""
+        if language:
+            return language
+        if self.config:
+            return self.config.get_spell_check_language()
+        return 'pt_BR'
 
-        except ImportError as e:
-            print(_("Enchant not available for spell checking: {}").format(e))
-            self.available_languages = ['pt_BR', 'en_US', 'es_ES', 'fr_FR', 'de_DE']
+    def preload_dictionary(self, callback):
+        """Load the configured dictionary in the worker, then call back on the main loop"""
+        global _spell_executor
+
+        spell_language = self._get_spell_language()
+        if spell_language in _loaded_dictionaries:
+            GLib.idle_add(callback)
+            return
+
+        # Callers arriving while the load runs wait for the same result
+        callbacks = _dictionary_callbacks.get(spell_language)
+        if callbacks is not None:
+            callbacks.append(callback)
+            return
+        _dictionary_callbacks[spell_language] = [callback]
+
+        if _spell_executor is None:
+            _spell_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='tac-spell')
+        future = _spell_executor.submit(_load_dictionary, spell_language)
+
+        # Runs in the worker thread; only hands the result to the main loop
+        future.add_done_callback(
+            lambda f: GLib.idle_add(_on_dictionary_loaded, spell_language, f)
+        )
+
+    def queue_spell_check(self, owner, callback):
+        """Queue a spell checker attach; a newer request replaces the owner's pending one"""
+        self._attach_queue.pop(owner, None)
+        self._attach_queue[owner] = callback
+        if self._attach_source_id is None:
+            self._attach_source_id = GLib.idle_add(self._process_attach_queue)
+        return False
+
+    def _process_attach_queue(self):
+        """Run one queued attach per main loop iteration"""
+        # Each attach checks a whole buffer, so frames can be drawn in between
+        if self._attach_queue:
+            _owner, callback = self._attach_queue.popitem(last=False)
+            callback()
+
+        if self._attach_queue:
+            return True
+
+        self._attach_source_id = None
+        return False
 
     def setup_spell_check(self, text_view, language=None):
         """Setup spell checking for a TextView using PyGTKSpellcheck"""
-        if not SPELL_CHECK_AVAILABLE:
+        if not _ensure_spell_module():
             return None
 
         try:
-            if language:
-                spell_language = language
-            elif self.config:
-                spell_language = self.config.get_spell_check_language()
-            else:
-                spell_language = 'pt_BR'
+            spell_language = self._get_spell_language(language)
 
-            spell_checker = gtkspellcheck.SpellChecker(text_view, language=spell_language)
+            spell_checker = _create_spell_checker(text_view, spell_language)
+            self._install_shared_dictionary(spell_checker)
 
-            checker_id = id(text_view)
-            self.spell_checkers[checker_id] = spell_checker
+            # The language setter replaces the dictionary, dropping the cache
+            try:
+                spell_checker.connect('language-changed', self._on_checker_language_changed)
+            except TypeError as e:
+                logger.debug("Spell checker has no language-changed signal: %s", e)
+            self.spell_checkers[text_view] = spell_checker
 
             return spell_checker
 
         except Exception as e:
-            print(_("Spell check setup failed: {}").format(e))
+            logger.warning("Spell check setup failed: %s", e)
             return None
 
+    def _on_checker_language_changed(self, spell_checker, language):
+        """Reinstall the shared dictionary after a context menu language change"""
+        self._install_shared_dictionary(spell_checker)
+
+    def _install_shared_dictionary(self, spell_checker):
+        """Give the checker its language's shared dictionary and suggestion cache"""
+        # gtkspellcheck has no API for this: it looks words up through its
+        # private _dictionary attribute, which its language setter reassigns
+        own_dictionary = getattr(spell_checker, '_dictionary', None)
+        if own_dictionary is None or isinstance(own_dictionary, _CachedDictionary):
+            return
+
+        # Every checker of a language uses the same Dict; the checker's own
+        # is released, so memory does not grow with the number of editors
+        language = getattr(spell_checker, 'language', None) or own_dictionary.tag
+        cached = self._cached_dictionaries.get(language)
+        if cached is None:
+            dictionary = _loaded_dictionaries.setdefault(language, own_dictionary)
+            cached = _CachedDictionary(dictionary, self._suggestion_cache)
+            self._cached_dictionaries[language] = cached
+        spell_checker._dictionary = cached
+
     def enable_spell_check(self, text_view, enabled=True):
         """Enable or disable spell checking for a TextView"""
-        if not SPELL_CHECK_AVAILABLE:
+        if not _ensure_spell_module():
             return
 
         try:
-            checker_id = id(text_view)
-            spell_checker = self.spell_checkers.get(checker_id)
+            spell_checker = self.spell_checkers.get(text_view)
 
             if spell_checker:
                 if enabled:
@@ -538,7 +1072,7 @@ class SpellCheckHelper:
                 else:
                     spell_checker.disable()
         except Exception as e:
-            print(_("Error toggling spell check: {}").format(e))
+            logger.warning("Error toggling spell check: %s", e)
 
 
 class WelcomeView(Gtk.Box):
@@ -570,6 +1104,7 @@ class WelcomeView(Gtk.Box):
         """Create main welcome content"""
         content_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
         content_box.set_halign(Gtk.Align.CENTER)
+        markup = _get_welcome_markup()
 
         # Icon
         icon = Gtk.Image.new_from_icon_name('document-edit-symbolic')
@@ -579,13 +1114,13 @@ class WelcomeView(Gtk.Box):
 
         # Title
         title = Gtk.Label()
-        title.set_markup("<span size='x-large' weight='bold'>" + _("Welcome to TAC") + "</span>")
+        title.set_markup(markup['title'])
         title.set_halign(Gtk.Align.CENTER)
         content_box.append(title)
 
         # Subtitle
         subtitle = Gtk.Label()
-        subtitle.set_markup("<span size='medium'>" + _("Continuous Argumentation Technique") + "</span>")
+        subtitle.set_markup(markup['subtitle'])
         subtitle.set_halign(Gtk.Align.CENTER)
         subtitle.add_css_class("dim-label")
         content_box.append(subtitle)
@@ -618,7 +1153,7 @@ class WelcomeView(Gtk.Box):
 
         # Note
         note = Gtk.Label()
-        note.set_markup("<span size='small'><i>" + _("Note:") + " " + _("exporting to ODT might require some adjustment in your Office Suite.") + "</i></span>")
+        note.set_markup(markup['note'])
         note.set_halign(Gtk.Align.CENTER)
         content_box.append(note)
 
@@ -628,6 +1163,8 @@ class WelcomeView(Gtk.Box):
         template_group.set_title(_("Start Writing"))
         template_group.set_description(_("Choose a template to get started"))
 
+        start_label = _("Start")
+
         # Template cards
         for template in DEFAULT_TEMPLATES:
             row = Adw.ActionRow()
@@ -636,16 +1173,21 @@ class WelcomeView(Gtk.Box):
 
             # Start button
             start_button = Gtk.Button()
-            start_button.set_label(_("Start"))
+            start_button.set_label(start_label)
             start_button.add_css_class("suggested-action")
             start_button.set_valign(Gtk.Align.CENTER)
-            start_button.connect('clicked', lambda btn, tmpl=template.name: self.emit('create-project', tmpl))
+            start_button.template_name = template.name
+            start_button.connect('clicked', self._on_template_start_clicked)
             row.add_suffix(start_button)
 
             template_group.add(row)
 
         self.append(template_group)
 
+    def _on_template_start_clicked(self, button):
+        """Handle template start button click"""
+        self.emit('create-project', button.template_name)
+
     def _on_wiki_clicked(self, button):
         """Handle wiki button click - open external browser"""
         import subprocess
@@ -661,7 +1203,7 @@ class WelcomeView(Gtk.Box):
             try:
                 subprocess.run(['xdg-open', wiki_url], check=False)
             except Exception as fallback_error:
-                print(_("Could not open wiki URL: {}").format(fallback_error))
+                logger.warning("Could not open wiki URL: %s", fallback_error)
 
     def _create_recent_section(self):
         """Create recent projects section"""
@@ -669,6 +1211,74 @@ class WelcomeView(Gtk.Box):
         pass
 
 
+class ProjectItem(GObject.Object):
+    """List model item holding the information of a single project"""
+
+    __gtype_name__ = 'TacProjectItem'
+
+    name = GObject.Property(type=str, default='')
+    description = GObject.Property(type=str, default='')
+    modified_at = GObject.Property(type=str, default='')
+    modified_text = GObject.Property(type=str, default='')
+    stats_text = GObject.Property(type=str, default='')
+    search_text = GObject.Property(type=str, default='')
+
+    def __init__(self, project_info, **kwargs):
+        super().__init__(**kwargs)
+        self.update(project_info)
+
+    def update(self, project_info) -> bool:
+        """Show a project's information, returning whether its search text changed"""
+        self.project_info = project_info
+        name = project_info.get('name', '')
+        description = project_info.get('description', '') or ''
+        modified_at = project_info.get('modified_at', '') or ''
+
+        # Only differing values are set, so bound rows are notified of real changes
+        if name != self.name:
+            self.name = name
+        if description != self.description:
+            self.description = description
+        if modified_at != self.modified_at:
+            self.modified_at = modified_at
+        modified_text = self._get_modified_text()
+        if modified_text != self.modified_text:
+            self.modified_text = modified_text
+        self.update_statistics(project_info.get('statistics', {}))
+
+        # Case-folded once, so filtering compares without folding each item
+        search_text = f"{name}\n{description}".casefold()
+        if search_text == self.search_text:
+            return False
+        self.search_text = search_text
+        return True
+
+    def _get_modified_text(self) -> str:
+        """Get the short modification date, formatting it only if not cached"""
+        cached = self.project_info.get('_modified_str_short')
+        if cached is not None:
+            return cached
+
+        if self.modified_at:
+            try:
+                modified_dt = datetime.fromisoformat(self.modified_at)
+                return FormatHelper.format_datetime(modified_dt, 'short')
+            except (ValueError, TypeError):
+                pass
+        return ''
+
+    def update_statistics(self, stats: dict):
+        """Store new statistics and refresh the formatted text"""
+        self.project_info['statistics'] = stats
+        stats_text = ''
+        if stats:
+            words = stats.get('total_words', 0)
+            paragraphs = stats.get('total_paragraphs', 0)
+            stats_text = FormatHelper.format_project_stats(words, paragraphs)
+        if stats_text != self.stats_text:
+            self.stats_text = stats_text
+
+
 class ProjectListWidget(Gtk.Box):
     """Widget for displaying and selecting projects"""
 
@@ -691,6 +1301,8 @@ class ProjectListWidget(Gtk.Box):
         self.search_entry.set_margin_bottom(5)
         self.search_entry.set_margin_start(25)
         self.search_entry.set_margin_end(25)
+        # search-changed is debounced by the entry itself
+        self.search_entry.set_search_delay(_SEARCH_FILTER_DELAY_MS)
         self.search_entry.connect('search-changed', self._on_search_changed)
         self.append(self.search_entry)
 
@@ -699,11 +1311,38 @@ class ProjectListWidget(Gtk.Box):
         scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
         scrolled.set_vexpand(True)
 
+        # Rename and delete dialogs, built on first use and reused
+        self._rename_dialog = None
+        self._rename_entry = None
+        self._delete_dialog = None
+        self._dialog_project_info = None
+
+        # Incremental loading state of refresh_projects
+        self._load_source_id = None
+        self._pending_projects = iter(())
+
+        # Project model: store -> filter -> selection
+        self.project_store = Gio.ListStore(item_type=ProjectItem)
+        self.project_filter = Gtk.StringFilter(
+            expression=Gtk.PropertyExpression.new(ProjectItem, None, 'search-text'),
+            match_mode=Gtk.StringFilterMatchMode.SUBSTRING,
+            ignore_case=False
+        )
+        self.filter_model = Gtk.FilterListModel(model=self.project_store, filter=self.project_filter)
+        self.selection_model = Gtk.SingleSelection(model=self.filter_model)
+        self.selection_model.set_autoselect(False)
+        self.selection_model.set_can_unselect(True)
+
+        # Row widgets are created once per visible slot and recycled
+        factory = Gtk.SignalListItemFactory()
+        factory.connect('setup', self._on_row_setup)
+        factory.connect('bind', self._on_row_bind)
+        factory.connect('unbind', self._on_row_unbind)
+
         # Project list
-        self.project_list = Gtk.ListBox()
-        self.project_list.set_selection_mode(Gtk.SelectionMode.SINGLE)
-        self.project_list.connect('row-activated', self._on_project_activated)
-        self.project_list.set_filter_func(self._filter_projects)
+        self.project_list = Gtk.ListView(model=self.selection_model, factory=factory)
+        self.project_list.set_single_click_activate(True)
+        self.project_list.connect('activate', self._on_project_activated)
 
         scrolled.set_child(self.project_list)
         self.append(scrolled)
@@ -713,42 +1352,64 @@ class ProjectListWidget(Gtk.Box):
 
     def refresh_projects(self):
         """Refresh the project list"""
-        # Clear existing projects
-        child = self.project_list.get_first_child()
-        while child:
-            next_child = child.get_next_sibling()
-            self.project_list.remove(child)
-            child = next_child
-
-        # Load projects
         projects = self.project_manager.list_projects()
 
-        for project_info in projects:
-            row = self._create_project_row(project_info)
-            self.project_list.append(row)
-            
+        # Stop streaming in the rows of a previous refresh
+        if self._load_source_id is not None:
+            GLib.source_remove(self._load_source_id)
+            self._load_source_id = None
+
+        # Shown items take the new data in place: their rows stay bound and
+        # only labels whose value changed are redrawn
+        shown = self.project_store.get_n_items()
+        kept = min(shown, len(projects))
+        search_changed = False
+        for position in range(kept):
+            if self.project_store.get_item(position).update(projects[position]):
+                search_changed = True
+
+        # The filter model does not watch items, so re-run an active search
+        if search_changed and self.project_filter.get_search():
+            self.project_filter.changed(Gtk.FilterChange.DIFFERENT)
+
+        if shown > kept:
+            self.project_store.splice(kept, shown - kept, [])
+            self._pending_projects = iter(())
+            return
+
+        # New projects are appended; the first chunk now, the rest from idle
+        # so the first rows paint immediately
+        self._pending_projects = iter(projects[kept:])
+        if self._load_project_chunk():
+            self._load_source_id = GLib.idle_add(
+                self._load_project_chunk, priority=GLib.PRIORITY_DEFAULT_IDLE
+            )
+
+    def _load_project_chunk(self):
+        """Append the next chunk of projects to the list"""
+        items = [ProjectItem(project_info) for project_info
+                 in itertools.islice(self._pending_projects, _PROJECT_LOAD_CHUNK)]
+        if items:
+            self.project_store.splice(self.project_store.get_n_items(), 0, items)
+
+        # A full chunk means more projects may be pending
+        if len(items) == _PROJECT_LOAD_CHUNK:
+            return True
+
+        self._load_source_id = None
+        self._pending_projects = iter(())
+        return False
+
     def update_project_statistics(self, project_id: str, stats: dict):
         """Update statistics for a specific project without full refresh"""
-        child = self.project_list.get_first_child()
-        while child:
-            if hasattr(child, 'project_info') and child.project_info['id'] == project_id:
-                # Update the project info
-                child.project_info['statistics'] = stats
-                
-                # Update the stats label if it exists
-                if hasattr(child, 'stats_label'):
-                    words = stats.get('total_words', 0)
-                    paragraphs = stats.get('total_paragraphs', 0)
-                    stats_text = FormatHelper.format_project_stats(words, paragraphs)
-                    child.stats_label.set_text(stats_text)
+        for position in range(self.project_store.get_n_items()):
+            item = self.project_store.get_item(position)
+            if item.project_info['id'] == project_id:
+                item.update_statistics(stats)
                 break
-            child = child.get_next_sibling()
-
-    def _create_project_row(self, project_info):
-        """Create a row for a project"""
-        row = Gtk.ListBoxRow()
-        row.project_info = project_info
 
+    def _on_row_setup(self, factory, list_item):
+        """Build the widgets of a project row"""
         # Main box
         box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
         box.set_margin_start(12)
@@ -761,7 +1422,6 @@ class ProjectListWidget(Gtk.Box):
 
         # Project name
         name_label = Gtk.Label()
-        name_label.set_text(project_info['name'])
         name_label.set_halign(Gtk.Align.START)
         name_label.set_ellipsize(3)
         name_label.add_css_class("heading")
@@ -772,9 +1432,9 @@ class ProjectListWidget(Gtk.Box):
         spacer.set_hexpand(True)
         header_box.append(spacer)
 
-        # Action buttons (initially hidden)
+        # Action buttons (revealed on row hover via CSS)
         actions_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=4)
-        actions_box.set_visible(False)
+        actions_box.add_css_class("row-actions")
 
         # Edit button
         edit_button = Gtk.Button()
@@ -782,7 +1442,7 @@ class ProjectListWidget(Gtk.Box):
         edit_button.set_tooltip_text(_("Rename project"))
         edit_button.add_css_class("flat")
         edit_button.add_css_class("circular")
-        edit_button.connect('clicked', lambda b: self._on_edit_project(project_info))
+        edit_button.connect('clicked', lambda b: self._on_edit_project(list_item.get_item().project_info))
         actions_box.append(edit_button)
 
         # Delete button
@@ -791,144 +1451,199 @@ class ProjectListWidget(Gtk.Box):
         delete_button.set_tooltip_text(_("Delete project"))
         delete_button.add_css_class("flat")
         delete_button.add_css_class("circular")
-        delete_button.connect('clicked', lambda b: self._on_delete_project(project_info))
+        delete_button.connect('clicked', lambda b: self._on_delete_project(list_item.get_item().project_info))
         actions_box.append(delete_button)
 
         header_box.append(actions_box)
 
         # Modification date
-        if project_info.get('modified_at'):
-            try:
-                modified_dt = datetime.fromisoformat(project_info['modified_at'])
-                date_label = Gtk.Label()
-                date_label.set_text(FormatHelper.format_datetime(modified_dt, 'short'))
-                date_label.add_css_class("caption")
-                date_label.add_css_class("dim-label")
-                header_box.append(date_label)
-            except (ValueError, TypeError):
-                pass
+        date_label = Gtk.Label()
+        date_label.add_css_class("caption")
+        date_label.add_css_class("dim-label")
+        header_box.append(date_label)
 
         box.append(header_box)
 
         # Statistics
-        stats = project_info.get('statistics', {})
-        if stats:
-            stats_label = Gtk.Label()
-            words = stats.get('total_words', 0)
-            paragraphs = stats.get('total_paragraphs', 0)
-            stats_text = FormatHelper.format_project_stats(words, paragraphs)
-            stats_label.set_text(stats_text)
-            stats_label.set_halign(Gtk.Align.START)
-            stats_label.add_css_class("caption")
-            stats_label.add_css_class("dim-label")
-            box.append(stats_label)
-            
-            # Store reference to stats label for easy updating
-            row.stats_label = stats_label
-
-        # Setup hover effect
-        hover_controller = Gtk.EventControllerMotion()
-        hover_controller.connect('enter', lambda c, x, y: actions_box.set_visible(True))
-        hover_controller.connect('leave', lambda c: actions_box.set_visible(False))
-        row.add_controller(hover_controller)
+        stats_label = Gtk.Label()
+        stats_label.set_halign(Gtk.Align.START)
+        stats_label.add_css_class("caption")
+        stats_label.add_css_class("dim-label")
+        box.append(stats_label)
+
+        # Store references for binding
+        box.name_label = name_label
+        box.date_label = date_label
+        box.stats_label = stats_label
+        box.bindings = []
+
+        list_item.set_child(box)
+
+    def _on_row_bind(self, factory, list_item):
+        """Fill a recycled row with the data of a project"""
+        box = list_item.get_child()
+        item = list_item.get_item()
+
+        # Labels follow the item, so in-place refreshes reach the row
+        box.bindings = [
+            item.bind_property('name', box.name_label, 'label',
+                               GObject.BindingFlags.SYNC_CREATE),
+            item.bind_property('modified-text', box.date_label, 'label',
+                               GObject.BindingFlags.SYNC_CREATE),
+            item.bind_property('modified-text', box.date_label, 'visible',
+                               GObject.BindingFlags.SYNC_CREATE,
+                               lambda binding, value: bool(value)),
+            item.bind_property('stats-text', box.stats_label, 'label',
+                               GObject.BindingFlags.SYNC_CREATE),
+            item.bind_property('stats-text', box.stats_label, 'visible',
+                               GObject.BindingFlags.SYNC_CREATE,
+                               lambda binding, value: bool(value)),
+        ]
 
-        row.set_child(box)
-        return row
+    def _on_row_unbind(self, factory, list_item):
+        """Release per-project state from a row about to be recycled"""
+        box = list_item.get_child()
+        for binding in box.bindings:
+            binding.unbind()
+        box.bindings = []
 
-    def _on_project_activated(self, listbox, row):
+    def _on_project_activated(self, list_view, position):
         """Handle project activation"""
-        if row and hasattr(row, 'project_info'):
-            self.emit('project-selected', row.project_info)
+        item = self.filter_model.get_item(position)
+        if item:
+            self.emit('project-selected', item.project_info)
 
     def _on_search_changed(self, search_entry):
         """Handle search text change"""
-        self.project_list.invalidate_filter()
-
-    def _filter_projects(self, row):
-        """Filter projects based on search text"""
-        search_text = self.search_entry.get_text().lower()
-        if not search_text:
-            return True
-
-        if hasattr(row, 'project_info'):
-            project_name = row.project_info.get('name', '').lower()
-            project_desc = row.project_info.get('description', '').lower()
-            return search_text in project_name or search_text in project_desc
-
-        return True
+        # Typing a character and deleting it within the delay changes nothing
+        text = search_entry.get_text().casefold()
+        if text != self.project_filter.get_search():
+            self.project_filter.set_search(text)
 
     def _on_edit_project(self, project_info):
         """Handle project rename"""
-        dialog = Adw.MessageDialog.new(
-            self.get_root(),
-            _("Rename Project"),
-            _("Enter new name for '{}'").format(project_info['name'])
-        )
+        dialog = self._get_rename_dialog()
+        self._dialog_project_info = project_info
+        dialog.set_body(_("Enter new name for '{}'").format(project_info['name']))
 
-        # Add entry for new name
-        entry = Gtk.Entry()
-        entry.set_text(project_info['name'])
-        entry.set_margin_start(20)
-        entry.set_margin_end(20)
-        entry.set_margin_top(10)
-        entry.set_margin_bottom(10)
+        self._rename_entry.set_text(project_info['name'])
 
         # Select all text for easy replacement
-        entry.grab_focus()
-        entry.select_region(0, -1)
-
-        dialog.set_extra_child(entry)
-        dialog.add_response("cancel", _("Cancel"))
-        dialog.add_response("rename", _("Rename"))
-        dialog.set_response_appearance("rename", Adw.ResponseAppearance.SUGGESTED)
-        dialog.set_default_response("rename")
-
-        def save_name():
-            """Save the new name"""
-            new_name = entry.get_text().strip()
-            if new_name and new_name != project_info['name']:
-                project = self.project_manager.load_project(project_info['id'])
-                if project:
-                    project.name = new_name
-                    self.project_manager.save_project(project)
-                    self.refresh_projects()
-            dialog.destroy()
-
-        def on_response(dialog, response):
-            if response == "rename":
-                save_name()
-            else:
-                dialog.destroy()
-
-        def on_entry_activate(entry):
-            save_name()
+        self._rename_entry.grab_focus()
+        self._rename_entry.select_region(0, -1)
 
-        entry.connect('activate', on_entry_activate)
-        dialog.connect('response', on_response)
         dialog.present()
 
+    def _get_rename_dialog(self):
+        """Build the rename dialog on first use; it is hidden, not destroyed, after each use"""
+        if self._rename_dialog is None:
+            dialog = Adw.MessageDialog.new(self.get_root(), _("Rename Project"), None)
+            dialog.set_hide_on_close(True)
+
+            # Add entry for new name
+            entry = Gtk.Entry()
+            entry.set_margin_start(20)
+            entry.set_margin_end(20)
+            entry.set_margin_top(10)
+            entry.set_margin_bottom(10)
+            entry.connect('activate', self._on_rename_entry_activate)
+
+            dialog.set_extra_child(entry)
+            dialog.add_response("cancel", _("Cancel"))
+            dialog.add_response("rename", _("Rename"))
+            dialog.set_response_appearance("rename", Adw.ResponseAppearance.SUGGESTED)
+            dialog.set_default_response("rename")
+            dialog.connect('response', self._on_rename_response)
+
+            self._rename_dialog = dialog
+            self._rename_entry = entry
+        return self._rename_dialog
+
+    def _save_project_name(self):
+        """Save the name typed in the rename dialog"""
+        project_info = self._dialog_project_info
+        new_name = self._rename_entry.get_text().strip()
+        if new_name and new_name != project_info['name']:
+            project = self.project_manager.load_project(project_info['id'])
+            if project:
+                project.name = new_name
+                self.project_manager.save_project(project)
+                self.refresh_projects()
+
+    def _on_rename_response(self, dialog, response):
+        """Handle rename dialog response"""
+        if response == "rename":
+            self._save_project_name()
+
+    def _on_rename_entry_activate(self, entry):
+        """Save the new name when Enter is pressed"""
+        self._save_project_name()
+        self._rename_dialog.close()
+
     def _on_delete_project(self, project_info):
         """Handle project deletion"""
-        dialog = Adw.MessageDialog.new(
-            self.get_root(),
-            _("Delete '{}'?").format(project_info['name']),
-            _("This project will be moved to trash and can be recovered.")
-        )
+        if self._delete_dialog is None:
+            dialog = Adw.MessageDialog.new(
+                self.get_root(),
+                None,
+                _("This project will be moved to trash and can be recovered.")
+            )
+            dialog.set_hide_on_close(True)
 
-        dialog.add_response("cancel", _("Cancel"))
-        dialog.add_response("delete", _("Delete"))
-        dialog.set_response_appearance("delete", Adw.ResponseAppearance.DESTRUCTIVE)
-        dialog.set_default_response("cancel")
+            dialog.add_response("cancel", _("Cancel"))
+            dialog.add_response("delete", _("Delete"))
+            dialog.set_response_appearance("delete", Adw.ResponseAppearance.DESTRUCTIVE)
+            dialog.set_default_response("cancel")
+            dialog.connect('response', self._on_delete_response)
 
-        def on_response(dialog, response):
-            if response == "delete":
-                success = self.project_manager.delete_project(project_info['id'])
-                if success:
-                    self.refresh_projects()
-            dialog.destroy()
+            self._delete_dialog = dialog
 
-        dialog.connect('response', on_response)
-        dialog.present()
+        self._dialog_project_info = project_info
+        self._delete_dialog.set_heading(_("Delete '{}'?").format(project_info['name']))
+        self._delete_dialog.present()
+
+    def _on_delete_response(self, dialog, response):
+        """Handle delete dialog response"""
+        if response == "delete":
+            success = self.project_manager.delete_project(self._dialog_project_info['id'])
+            if success:
+                self.refresh_projects()
+
+
+def _estimate_text_area_height(text: str, font_size=12) -> int:
+    """Guess the height a paragraph's text area will take for its text"""
+    scale = max(font_size, 1) / 12
+    line_height = _ESTIMATE_LINE_HEIGHT * scale
+    chars_per_line = max(1, int(_ESTIMATE_CHARS_PER_LINE / scale))
+    margins = _TEXT_VIEW_MARGIN_TOP + _TEXT_VIEW_MARGIN_BOTTOM
+
+    # Text long enough to fill the area needs no line count
+    max_lines = (_TEXT_AREA_MAX_HEIGHT - margins) / line_height
+    if len(text) >= chars_per_line * max_lines:
+        return _TEXT_AREA_MAX_HEIGHT
+
+    lines = sum(len(line) // chars_per_line + 1 for line in text.split('\n'))
+    height = int(lines * line_height) + margins
+    return max(_TEXT_AREA_MIN_HEIGHT, min(height, _TEXT_AREA_MAX_HEIGHT))
+
+
+class _EditorPlaceholder(Gtk.Box):
+    """Stand-in for a deferred text area that reports its layout changes"""
+
+    __gtype_name__ = 'TacEditorPlaceholder'
+
+    def __init__(self, on_resized, **kwargs):
+        super().__init__(**kwargs)
+        self._on_resized = on_resized
+        self._allocated_height = 0
+        self.set_focusable(True)
+
+    def do_size_allocate(self, width, height, baseline):
+        Gtk.Box.do_size_allocate(self, width, height, baseline)
+        # Only a new height can move the editor into or out of view
+        if height != self._allocated_height:
+            self._allocated_height = height
+            self._on_resized()
 
 
 class ParagraphEditor(Gtk.Box):
@@ -940,20 +1655,46 @@ class ParagraphEditor(Gtk.Box):
         'content-changed': (GObject.SIGNAL_RUN_FIRST, None, ()),
         'remove-requested': (GObject.SIGNAL_RUN_FIRST, None, (str,)),
         'paragraph-reorder': (GObject.SIGNAL_RUN_FIRST, None, (str, str, str)),
+        # A deferred text area was mapped or resized and may now be visible
+        'placeholder-shown': (GObject.SIGNAL_RUN_FIRST, None, ()),
     }
 
-    def __init__(self, paragraph: Paragraph, config=None, **kwargs):
+    # Translated type labels, shared by all editors
+    _TYPE_LABELS = None
+
+    # Whether widget paintables work as drag icons (None until tried)
+    _drag_icon_supported = None
+
+    def __init__(self, paragraph: Paragraph, config=None, lazy=False, **kwargs):
         super().__init__(orientation=Gtk.Orientation.VERTICAL, **kwargs)
         self.paragraph = paragraph
         self.config = config
         self.text_view = None
         self.text_buffer = None
         self.is_dragging = False
+
+        # Drag icon, created on the first drag and reused after that
+        self._drag_paintable = None
+
+        # Stands in for the text area until ensure_text_editor() builds it
+        self._placeholder = None
+
+        # Pending debounced text change source
+        self._text_changed_id = None
+
+        # Word count kept up to date from buffer edits
+        self._word_count = TextHelper.count_words(paragraph.content)
+        self._displayed_word_count = None
         
         # Spell check components - initialize once
         self.spell_checker = None
         self.spell_helper = None
         self._spell_check_setup = False
+        self._focus_controller = None
+        self._destroyed = False
+
+        # Formatting last applied to the text view, as sorted items
+        self._last_formatting = None
         
         # Footnote badge reference
         self.footnote_badge = None
@@ -965,17 +1706,30 @@ class ParagraphEditor(Gtk.Box):
         self.set_margin_top(4)
         self.set_margin_bottom(4)
 
-        # Create text editor
-        self._create_text_editor()
+        # Create text editor, or reserve its space when deferred
+        if lazy:
+            self._create_placeholder()
+        else:
+            self._create_text_editor()
         # Create header
         self._create_header()
         # Setup drag and drop
         self._setup_drag_and_drop()
         # Connect realize signal to apply initial formatting
         self.connect('realize', self._on_realize)
+        self.connect('destroy', self._on_destroy)
+
+    def _on_destroy(self, widget):
+        """Mark the editor as gone so late callbacks do nothing"""
+        self._destroyed = True
 
     def _on_realize(self, widget):
         """Called when widget is shown for the first time"""
+        if self.text_view:
+            self._setup_text_view()
+
+    def _setup_text_view(self):
+        """Apply formatting and spell check to a realized text view"""
         try:
             formatting = self.paragraph.formatting
             font_family = formatting.get('font_family', 'Adwaita Sans')
@@ -998,11 +1752,18 @@ class ParagraphEditor(Gtk.Box):
             
             self._apply_formatting()
             
-            # Setup spell check synchronously after text_view is ready
-            self._setup_spell_check()
-            
         except Exception as e:
-            print(_("Error during paragraph editor initialization: {}").format(e))
+            logger.warning("Error during paragraph editor initialization: %s", e)
+
+    def _on_text_view_focus_enter(self, controller):
+        """Set up spell check the first time the paragraph is focused"""
+        # Paragraphs the user never edits never pay for spell check
+        if not self._spell_check_setup:
+            self._setup_spell_check()
+
+    def _on_text_view_focus_leave(self, controller):
+        """Save pending edits when the user moves to another widget"""
+        self.flush_pending_changes()
 
     def _setup_spell_check(self):
         """Setup spell check once when text view is ready"""
@@ -1017,12 +1778,34 @@ class ParagraphEditor(Gtk.Box):
             if hasattr(self.get_root(), 'spell_helper'):
                 self.spell_helper = self.get_root().spell_helper
             else:
-                self.spell_helper = SpellCheckHelper(self.config)
+                self.spell_helper = SpellCheckHelper.get_shared(self.config)
             
-            self.spell_checker = self.spell_helper.setup_spell_check(self.text_view)
+            # Load the dictionary off the main loop, attach when ready
             self._spell_check_setup = True
+            self.spell_helper.preload_dictionary(self._queue_spell_checker)
+        except Exception as e:
+            self._spell_check_setup = False
+            logger.warning("Spell check setup failed: %s", e)
+
+    def _queue_spell_checker(self):
+        """Wait for other editors' attaches before attaching ours"""
+        self.spell_helper.queue_spell_check(self, self._attach_spell_checker)
+        return False
+
+    def _attach_spell_checker(self):
+        """Attach the spell checker once its dictionary has loaded"""
+        if (self._destroyed or not self.text_view.get_realized()
+                or not self.config.get_spell_check_enabled()):
+            # Allow a later realize or toggle to retry
+            self._spell_check_setup = False
+            return False
+
+        try:
+            self.spell_checker = self.spell_helper.setup_spell_check(self.text_view)
         except Exception as e:
-            print(_("Spell check setup failed: {}").format(e))
+            logger.warning("Spell check setup failed: %s", e)
+
+        return False
 
     def _create_header(self):
         """Create paragraph header with type and controls"""
@@ -1077,7 +1860,7 @@ class ParagraphEditor(Gtk.Box):
             self.footnote_badge = None
 
         # Spell check toggle button
-        if SPELL_CHECK_AVAILABLE and self.config:
+        if self.config and _ensure_spell_module():
             self.spell_button = Gtk.ToggleButton()
             self.spell_button.set_icon_name('tools-check-spelling-symbolic')
             self.spell_button.set_tooltip_text(_("Toggle spell checking"))
@@ -1105,10 +1888,14 @@ class ParagraphEditor(Gtk.Box):
 
     def _on_spell_check_toggled(self, button):
         """Handle spell check toggle"""
-        if not self.spell_helper or not self.text_view:
-            return
-        
         enabled = button.get_active()
+
+        # Saved first so a paragraph still waiting for focus sees it
+        if self.config:
+            self.config.set_spell_check_enabled(enabled)
+
+        if not self.text_view:
+            return
         
         if enabled and not self._spell_check_setup:
             self._setup_spell_check()
@@ -1116,17 +1903,25 @@ class ParagraphEditor(Gtk.Box):
             try:
                 self.spell_helper.enable_spell_check(self.text_view, enabled)
             except Exception as e:
-                print(_("Error toggling spell check: {}").format(e))
-        
-        if self.config:
-            self.config.set_spell_check_enabled(enabled)
+                logger.warning("Error toggling spell check: %s", e)
 
     def _create_text_editor(self):
         """Create the text editing area"""
         # Text buffer
         self.text_buffer = Gtk.TextBuffer()
         self.text_buffer.set_text(self.paragraph.content)
-        self.text_buffer.connect('changed', self._on_text_changed)
+
+        # Formatting tag, created by _apply_formatting the first time the
+        # paragraph is styled; plain paragraphs never need one
+        self._format_tag = None
+
+        # Edits are tracked from insert/delete; 'changed' would only add a
+        # third handler per keystroke without saying what changed
+        self._buffer_handler_ids = [
+            self.text_buffer.connect('insert-text', self._on_text_inserted),
+            self.text_buffer.connect_after('insert-text', self._on_text_inserted_after),
+            self.text_buffer.connect('delete-range', self._on_range_deleted),
+        ]
 
         # Text view
         self.text_view = Gtk.TextView()
@@ -1136,17 +1931,74 @@ class ParagraphEditor(Gtk.Box):
         self.text_view.set_accepts_tab(False)
         self.text_view.set_margin_start(12)
         self.text_view.set_margin_end(12)
-        self.text_view.set_margin_top(8)
-        self.text_view.set_margin_bottom(12)
+        self.text_view.set_margin_top(_TEXT_VIEW_MARGIN_TOP)
+        self.text_view.set_margin_bottom(_TEXT_VIEW_MARGIN_BOTTOM)
+
+        # Focus attaches spell check lazily and saves edits on leave
+        self._focus_controller = Gtk.EventControllerFocus()
+        self._focus_controller.connect('enter', self._on_text_view_focus_enter)
+        self._focus_controller.connect('leave', self._on_text_view_focus_leave)
+        self.text_view.add_controller(self._focus_controller)
 
         # Scrolled window
         scrolled = Gtk.ScrolledWindow()
         scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
-        scrolled.set_min_content_height(100)
-        scrolled.set_max_content_height(300)
+        scrolled.set_min_content_height(_TEXT_AREA_MIN_HEIGHT)
+        scrolled.set_max_content_height(_TEXT_AREA_MAX_HEIGHT)
         scrolled.set_child(self.text_view)
 
-        self.append(scrolled)
+        # The text area always comes before the header
+        self.prepend(scrolled)
+
+    def _create_placeholder(self):
+        """Reserve the text area's height without building it"""
+        # Sized like the text area it stands for, so swapping it for the
+        # real editor while scrolling barely moves the content
+        font_size = self.paragraph.formatting.get('font_size', 12)
+        height = _estimate_text_area_height(self.paragraph.content, font_size)
+        self._placeholder = _EditorPlaceholder(self._on_placeholder_shown)
+        self._placeholder.set_size_request(-1, height)
+        self._placeholder.connect('map', self._on_placeholder_shown)
+
+        # Clicking or tabbing into the placeholder builds the editor at once
+        click = Gtk.GestureClick()
+        click.connect('pressed', self._on_placeholder_pressed)
+        self._placeholder.add_controller(click)
+        focus = Gtk.EventControllerFocus()
+        focus.connect('enter', self._on_placeholder_focus_enter)
+        self._placeholder.add_controller(focus)
+
+        self.prepend(self._placeholder)
+
+    def _on_placeholder_shown(self, *args):
+        """Let the owner check whether the deferred text area is visible"""
+        self.emit('placeholder-shown')
+
+    def _on_placeholder_pressed(self, gesture, n_press, x, y):
+        """Build and focus the text area when the placeholder is clicked"""
+        self._activate_placeholder()
+
+    def _on_placeholder_focus_enter(self, controller):
+        """Build and focus the text area when the placeholder gets focus"""
+        self._activate_placeholder()
+
+    def _activate_placeholder(self):
+        """Replace the placeholder with the real editor and focus it"""
+        if self.text_view is not None:
+            return
+        self.ensure_text_editor()
+        self.text_view.grab_focus()
+
+    def ensure_text_editor(self):
+        """Build the text area if its construction was deferred"""
+        if self.text_view is not None:
+            return
+
+        self.remove(self._placeholder)
+        self._placeholder = None
+        self._create_text_editor()
+        if self.get_realized():
+            self._setup_text_view()
 
     def _setup_drag_and_drop(self):
         """Setup drag and drop functionality for reordering paragraphs"""
@@ -1156,82 +2008,67 @@ class ParagraphEditor(Gtk.Box):
         drag_source.connect('drag-begin', self._on_drag_begin)
         drag_source.connect('drag-end', self._on_drag_end)
         self.add_controller(drag_source)
+        self._dnd_controllers = [drag_source]
 
-        drop_target = Gtk.DropTarget()
-        drop_target.set_gtypes([GObject.TYPE_STRING])
-        drop_target.set_actions(Gdk.DragAction.MOVE)
-        drop_target.connect('accept', self._on_drop_accept)
-        drop_target.connect('enter', self._on_drop_enter)
-        drop_target.connect('leave', self._on_drop_leave)
-        drop_target.connect('drop', self._on_drop)
-        self.add_controller(drop_target)
+        # Drops are handled by the container's ParagraphDropTarget
 
-    def _on_drag_prepare(self, drag_source, x, y):
+    # Drag and drop handlers are shared by all editors: they resolve the
+    # editor from their controller, so no bound method is kept per widget
+    @staticmethod
+    def _on_drag_prepare(drag_source, x, y):
         """Prepare drag operation"""
-        content = Gdk.ContentProvider.new_for_value(self.paragraph.id)
-        return content
+        editor = drag_source.get_widget()
+        id_bytes = GLib.Bytes.new(editor.paragraph.id.encode('ascii'))
+        return Gdk.ContentProvider.new_for_bytes(_PARAGRAPH_DRAG_MIME, id_bytes)
 
-    def _on_drag_begin(self, drag_source, drag):
+    @staticmethod
+    def _on_drag_begin(drag_source, drag):
         """Start drag operation"""
-        self.is_dragging = True
-        self.add_css_class("dragging")
-        try:
-            paintable = Gtk.WidgetPaintable.new(self)
-            drag_source.set_icon(paintable, 0, 0)
-        except Exception:
-            pass
-
-    def _on_drag_end(self, drag_source, drag, delete_data):
+        editor = drag_source.get_widget()
+        editor.is_dragging = True
+        editor.add_css_class(_CSS_DRAGGING)
+
+        # Probe widget drag icons once; after that use or skip them directly
+        if ParagraphEditor._drag_icon_supported:
+            drag_source.set_icon(editor._get_drag_paintable(), 0, 0)
+        elif ParagraphEditor._drag_icon_supported is None:
+            try:
+                drag_source.set_icon(editor._get_drag_paintable(), 0, 0)
+                ParagraphEditor._drag_icon_supported = True
+            except (GLib.Error, TypeError, AttributeError):
+                ParagraphEditor._drag_icon_supported = False
+
+    def _get_drag_paintable(self):
+        """Get the paintable showing this editor as its drag icon"""
+        # A widget paintable follows the widget live, so one per editor is enough
+        if self._drag_paintable is None:
+            self._drag_paintable = Gtk.WidgetPaintable.new(self)
+        return self._drag_paintable
+
+    @staticmethod
+    def _on_drag_end(drag_source, drag, delete_data):
         """End drag operation"""
-        self.is_dragging = False
-        self.remove_css_class("dragging")
-        self.remove_css_class("drop-target")
-
-    def _on_drop_accept(self, drop_target, drop):
-        """Check if drop is acceptable"""
-        return drop.get_formats().contain_gtype(GObject.TYPE_STRING)
-
-    def _on_drop_enter(self, drop_target, x, y):
-        """Handle drop enter"""
-        self.add_css_class("drop-target")
-        return Gdk.DragAction.MOVE
-
-    def _on_drop_leave(self, drop_target):
-        """Handle drop leave"""
-        self.remove_css_class("drop-target")
-
-    def _on_drop(self, drop_target, value, x, y):
-        """Handle drop operation"""
-        self.remove_css_class("drop-target")
-
-        if isinstance(value, str):
-            dragged_paragraph_id = value
-            target_paragraph_id = self.paragraph.id
-
-            if dragged_paragraph_id == target_paragraph_id:
-                return False
-
-            widget_height = self.get_allocated_height()
-            drop_position = "after" if y > widget_height / 2 else "before"
-
-            self.emit('paragraph-reorder', dragged_paragraph_id, target_paragraph_id, drop_position)
-            return True
-
-        return False
+        editor = drag_source.get_widget()
+        editor.is_dragging = False
+        editor.remove_css_class(_CSS_DRAGGING)
 
     def _get_type_label(self) -> str:
         """Get display label for paragraph type"""
-        type_labels = {
-            ParagraphType.TITLE_1: _("Title 1"),
-            ParagraphType.TITLE_2: _("Title 2"),
-            ParagraphType.INTRODUCTION: _("Introduction"),
-            ParagraphType.ARGUMENT: _("Argument"),
-            ParagraphType.ARGUMENT_RESUMPTION: _("Argument Resumption"),
-            ParagraphType.QUOTE: _("Quote"),
-            ParagraphType.EPIGRAPH: _("Epigraph"),
-            ParagraphType.CONCLUSION: _("Conclusion")
-        }
-        return type_labels.get(self.paragraph.type, _("Paragraph"))
+        type_labels = ParagraphEditor._TYPE_LABELS
+        if type_labels is None:
+            # Built on first use, after the locale has been set up
+            type_labels = ParagraphEditor._TYPE_LABELS = {
+                ParagraphType.TITLE_1: _("Title 1"),
+                ParagraphType.TITLE_2: _("Title 2"),
+                ParagraphType.INTRODUCTION: _("Introduction"),
+                ParagraphType.ARGUMENT: _("Argument"),
+                ParagraphType.ARGUMENT_RESUMPTION: _("Argument Resumption"),
+                ParagraphType.QUOTE: _("Quote"),
+                ParagraphType.EPIGRAPH: _("Epigraph"),
+                ParagraphType.CONCLUSION: _("Conclusion"),
+                None: _("Paragraph"),
+            }
+        return type_labels.get(self.paragraph.type, type_labels[None])
 
     def _apply_formatting(self):
         """Apply formatting using TextBuffer tags (GTK4 mode)"""
@@ -1240,29 +2077,44 @@ class ParagraphEditor(Gtk.Box):
     
         formatting = self.paragraph.formatting
 
-        # Create text tags
-        tag_table = self.text_buffer.get_tag_table()
-
-        # Remove existing format tag
-        existing_tag = tag_table.lookup("format")
-        if existing_tag:
-            tag_table.remove(existing_tag)
+        # Skip when nothing changed since the last application
+        # Compared by value: equal hashes would not prove equal formatting
+        formatting_items = tuple(sorted(formatting.items()))
+        if formatting_items == self._last_formatting:
+            return
 
-        # Create new formatting tag
-        format_tag = self.text_buffer.create_tag("format")
+        styles = (formatting.get('bold', False),
+                  formatting.get('italic', False),
+                  formatting.get('underline', False))
+
+        # Plain paragraphs need no tag until they are first styled
+        if self._format_tag is None and any(styles):
+            # Created once and applied to the whole text; later
+            # formatting changes only update its properties
+            self._format_tag = self.text_buffer.create_tag("format")
+            self.text_buffer.apply_tag(
+                self._format_tag,
+                self.text_buffer.get_start_iter(),
+                self.text_buffer.get_end_iter()
+            )
 
-        # Apply styles
-        if formatting.get('bold', False):
-            format_tag.set_property("weight", 700)
-        if formatting.get('italic', False):
-            format_tag.set_property("style", 2)
-        if formatting.get('underline', False):
-            format_tag.set_property("underline", 1)
+        format_tag = self._format_tag
+        if format_tag is not None:
+            bold, italic, underline = styles
 
-        # Apply tag to all text
-        start_iter = self.text_buffer.get_start_iter()
-        end_iter = self.text_buffer.get_end_iter()
-        self.text_buffer.apply_tag(format_tag, start_iter, end_iter)
+            # Update styles in place; text already tagged picks them up
+            if bold:
+                format_tag.set_property("weight", 700)
+            else:
+                format_tag.set_property("weight-set", False)
+            if italic:
+                format_tag.set_property("style", 2)
+            else:
+                format_tag.set_property("style-set", False)
+            if underline:
+                format_tag.set_property("underline", 1)
+            else:
+                format_tag.set_property("underline-set", False)
 
         # Apply margins
         left_margin = formatting.get('indent_left', 0.0)
@@ -1270,20 +2122,60 @@ class ParagraphEditor(Gtk.Box):
         self.text_view.set_left_margin(int(left_margin * 28))
         self.text_view.set_right_margin(int(right_margin * 28))
 
+        self._last_formatting = formatting_items
+
     def _update_word_count(self):
-        """Update word count display"""
-        word_count = TextHelper.count_words(self.paragraph.content)
-        self.word_count_label.set_text(_("{count} words").format(count=word_count))
+        """Update word count display when the count changes"""
+        if self._word_count == self._displayed_word_count:
+            return
+
+        self._displayed_word_count = self._word_count
+        self.word_count_label.set_text(_("{count} words").format(count=self._word_count))
+
+    def _on_text_inserted(self, buffer, location, text, length):
+        """Adjust word count for inserted text without recounting the buffer"""
+        self._word_count += _inserted_word_delta(location, text)
+        self._schedule_text_flush()
+
+    def _on_text_inserted_after(self, buffer, location, text, length):
+        """Extend the format tag over just the inserted text"""
+        if self._format_tag is None:
+            return
+
+        # After insertion, location points at the end of the new text
+        start_iter = location.copy()
+        start_iter.backward_chars(len(text))
+        buffer.apply_tag(self._format_tag, start_iter, location)
+
+    def _on_range_deleted(self, buffer, start, end):
+        """Adjust word count for deleted text without recounting the buffer"""
+        self._word_count += _deleted_word_delta(buffer, start, end)
+        self._schedule_text_flush()
 
-    def _on_text_changed(self, buffer):
-        """Handle text changes"""
-        start_iter = buffer.get_start_iter()
-        end_iter = buffer.get_end_iter()
-        text = buffer.get_text(start_iter, end_iter, False)
+    def _schedule_text_flush(self):
+        """Coalesce bursts of edits into one content update"""
+        if self._text_changed_id is not None:
+            GLib.source_remove(self._text_changed_id)
+        self._text_changed_id = GLib.timeout_add(_TEXT_CHANGE_DELAY_MS, self._flush_text_changed)
+
+    def _flush_text_changed(self):
+        """Apply buffered text changes to the paragraph"""
+        self._text_changed_id = None
+
+        start_iter = self.text_buffer.get_start_iter()
+        end_iter = self.text_buffer.get_end_iter()
+        text = self.text_buffer.get_text(start_iter, end_iter, False)
 
         self.paragraph.update_content(text)
         self._update_word_count()
         self.emit('content-changed')
+        return False
+
+    def flush_pending_changes(self):
+        """Apply text changes still waiting for the debounce delay"""
+        if self._text_changed_id is not None:
+            GLib.source_remove(self._text_changed_id)
+            self._flush_text_changed()
 
     def _on_remove_clicked(self, button):
         """Handle remove button click"""
@@ -1305,8 +2197,39 @@ class ParagraphEditor(Gtk.Box):
     def _on_remove_confirmed(self, dialog, response):
         """Handle remove confirmation"""
         if response == "remove":
+            self._release_resources()
             self.emit('remove-requested', self.paragraph.id)
         dialog.destroy()
+
+    def _release_resources(self):
+        """Break the editor's signal and controller references once removed"""
+        self._destroyed = True
+
+        if self._text_changed_id is not None:
+            GLib.source_remove(self._text_changed_id)
+            self._text_changed_id = None
+
+        if self.text_buffer:
+            for handler_id in self._buffer_handler_ids:
+                self.text_buffer.disconnect(handler_id)
+            self._buffer_handler_ids = []
+
+        if self._focus_controller is not None:
+            self.text_view.remove_controller(self._focus_controller)
+            self._focus_controller = None
+
+        if self.spell_checker:
+            self.spell_helper.enable_spell_check(self.text_view, False)
+            self.spell_checker = None
+
+        for controller in self._dnd_controllers:
+            self.remove_controller(controller)
+        self._dnd_controllers = []
+
+        # The paintable holds a reference back to this editor
+        if self._drag_paintable is not None:
+            self._drag_paintable.set_widget(None)
+            self._drag_paintable = None
         
     def _on_footnote_clicked(self, button):
         """Handle footnote button click"""
@@ -1344,6 +2267,114 @@ class ParagraphEditor(Gtk.Box):
             self.footnote_badge.set_tooltip_text("")
 
 
+class ParagraphDropTarget:
+    """Single drop target reordering the paragraph editors of a container"""
+
+    def __init__(self, container):
+        self.container = container
+        self._highlighted_editor = None
+
+        self.controller = Gtk.DropTargetAsync.new(
+            Gdk.ContentFormats.new([_PARAGRAPH_DRAG_MIME]), Gdk.DragAction.MOVE
+        )
+        self.controller.connect('accept', self._on_drop_accept)
+        self.controller.connect('drag-enter', self._on_drop_motion)
+        self.controller.connect('drag-motion', self._on_drop_motion)
+        self.controller.connect('drag-leave', self._on_drop_leave)
+        self.controller.connect('drop', self._on_drop)
+        container.add_controller(self.controller)
+
+    def _get_editor_at(self, x, y):
+        """Find the paragraph editor under a point of the container"""
+        widget = self.container.pick(x, y, Gtk.PickFlags.DEFAULT)
+        while widget is not None and widget is not self.container:
+            if isinstance(widget, ParagraphEditor):
+                return widget
+            widget = widget.get_parent()
+        return None
+
+    def _set_highlighted_editor(self, editor):
+        """Move the drop highlight, touching CSS only when the editor changes"""
+        if editor is self._highlighted_editor:
+            return
+
+        if self._highlighted_editor is not None:
+            self._highlighted_editor.remove_css_class(_CSS_DROP_TARGET)
+        if editor is not None:
+            editor.add_css_class(_CSS_DROP_TARGET)
+        self._highlighted_editor = editor
+
+    @staticmethod
+    def _on_drop_accept(drop_target, drop):
+        """Check if drop is acceptable"""
+        return drop.get_formats().contain_mime_type(_PARAGRAPH_DRAG_MIME)
+
+    def _on_drop_motion(self, drop_target, drop, x, y):
+        """Highlight the paragraph under the pointer"""
+        editor = self._get_editor_at(x, y)
+        self._set_highlighted_editor(editor)
+        return Gdk.DragAction.MOVE if editor is not None else 0
+
+    def _on_drop_leave(self, drop_target, drop):
+        """Handle drop leave"""
+        self._set_highlighted_editor(None)
+
+    def _on_drop(self, drop_target, drop, x, y):
+        """Handle drop operation"""
+        self._set_highlighted_editor(None)
+        editor = self._get_editor_at(x, y)
+        if editor is None:
+            return False
+
+        found, bounds = editor.compute_bounds(self.container)
+        midpoint = bounds.get_y() + bounds.get_height() / 2 if found else y
+        drop_position = "after" if y > midpoint else "before"
+
+        drop.read_async([_PARAGRAPH_DRAG_MIME], GLib.PRIORITY_DEFAULT, None,
+                        ParagraphDropTarget._on_drop_stream_ready,
+                        (editor, drop_position))
+        return True
+
+    @staticmethod
+    def _on_drop_stream_ready(drop, result, data):
+        """Start reading the dragged paragraph id"""
+        try:
+            stream, _mime_type = drop.read_finish(result)
+        except GLib.Error as e:
+            logger.warning("Could not read dropped paragraph: %s", e)
+            drop.finish(0)
+            return
+
+        # Local drags are written from the main loop, so read asynchronously;
+        # splicing reads until end of stream, a single read may come up short
+        output = Gio.MemoryOutputStream.new_resizable()
+        output.splice_async(stream,
+                            Gio.OutputStreamSpliceFlags.CLOSE_SOURCE
+                            | Gio.OutputStreamSpliceFlags.CLOSE_TARGET,
+                            GLib.PRIORITY_DEFAULT, None,
+                            ParagraphDropTarget._on_drop_data_read,
+                            (drop, data))
+
+    @staticmethod
+    def _on_drop_data_read(output, result, data):
+        """Finish the drop once the whole paragraph id has been read"""
+        drop, (editor, drop_position) = data
+        try:
+            output.splice_finish(result)
+            dragged_paragraph_id = output.steal_as_bytes().get_data().decode('ascii')
+        except (GLib.Error, UnicodeDecodeError) as e:
+            logger.warning("Could not read dropped paragraph: %s", e)
+            dragged_paragraph_id = None
+
+        target_paragraph_id = editor.paragraph.id
+        if not dragged_paragraph_id or dragged_paragraph_id == target_paragraph_id:
+            drop.finish(0)
+            return
+
+        drop.finish(Gdk.DragAction.MOVE)
+        editor.emit('paragraph-reorder', dragged_paragraph_id, target_paragraph_id, drop_position)
+
+
 class TextEditor(Gtk.Box):
     """Advanced text editor component"""
 
@@ -1351,6 +2382,8 @@ class TextEditor(Gtk.Box):
 
     __gsignals__ = {
         'content-changed': (GObject.SIGNAL_RUN_FIRST, None, (str,)),
+        # Character count and word count change since the last emission
+        'content-stats-changed': (GObject.SIGNAL_RUN_FIRST, None, (GObject.TYPE_UINT, int)),
     }
 
     def __init__(self, initial_text: str = "", config=None, **kwargs):
@@ -1358,11 +2391,19 @@ class TextEditor(Gtk.Box):
         self.config = config
         
         self.spell_checker = None
-        self.spell_helper = SpellCheckHelper(config) if config else None
+        self.spell_helper = SpellCheckHelper.get_shared(config) if config else None
+
+        # Pending debounced text change source
+        self._text_changed_id = None
+
+        # Word count kept up to date from buffer edits
+        self._word_count = TextHelper.count_words(initial_text)
+        self._word_count_delta = 0
 
         self.text_buffer = Gtk.TextBuffer()
         self.text_buffer.set_text(initial_text)
-        self.text_buffer.connect('changed', self._on_text_changed)
+        self.text_buffer.connect('insert-text', self._on_text_inserted)
+        self.text_buffer.connect('delete-range', self._on_range_deleted)
 
         self.text_view = Gtk.TextView()
         self.text_view.set_buffer(self.text_buffer)
@@ -1375,26 +2416,69 @@ class TextEditor(Gtk.Box):
         scrolled.set_vexpand(True)
 
         self.append(scrolled)
-        
-        GLib.idle_add(self._setup_spell_check_delayed)
+
+        # Spell check is attached once, when the view is first realized
+        self._realize_handler_id = self.text_view.connect('realize', self._on_text_view_realize)
+
+    def _on_text_view_realize(self, text_view):
+        """Run one-time setup for the realized text view"""
+        text_view.disconnect(self._realize_handler_id)
+        self._realize_handler_id = None
+        self._setup_spell_check_delayed()
 
     def _setup_spell_check_delayed(self):
         """Setup spell checking after widget is realized"""
         if not self.spell_helper or not self.text_view:
-            return False
+            return
         
         if self.config and self.config.get_spell_check_enabled():
             try:
                 self.spell_checker = self.spell_helper.setup_spell_check(self.text_view)
             except Exception as e:
-                print(_("Error setting up spell check: {}").format(e))
-        
+                logger.warning("Error setting up spell check: %s", e)
+
+    def _schedule_text_flush(self):
+        """Coalesce bursts of edits into one change notification"""
+        if self._text_changed_id is not None:
+            GLib.source_remove(self._text_changed_id)
+        self._text_changed_id = GLib.timeout_add(_TEXT_CHANGE_DELAY_MS, self._flush_text_changed)
+
+    def _on_text_inserted(self, buffer, location, text, length):
+        """Track word count for inserted text"""
+        delta = _inserted_word_delta(location, text)
+        self._word_count += delta
+        self._word_count_delta += delta
+        self._schedule_text_flush()
+
+    def _on_range_deleted(self, buffer, start, end):
+        """Track word count for deleted text"""
+        delta = _deleted_word_delta(buffer, start, end)
+        self._word_count += delta
+        self._word_count_delta += delta
+        self._schedule_text_flush()
+
+    def _flush_text_changed(self):
+        """Emit the buffered text change"""
+        self._text_changed_id = None
+
+        delta, self._word_count_delta = self._word_count_delta, 0
+        self.emit('content-stats-changed', self.text_buffer.get_char_count(), delta)
+
+        # Only copy the buffer out when someone wants the full text
+        signal_id = GObject.signal_lookup('content-changed', TextEditor)
+        if GObject.signal_has_handler_pending(self, signal_id, 0, False):
+            self.emit('content-changed', self.get_text())
         return False
 
-    def _on_text_changed(self, buffer):
-        """Handle text buffer changes"""
-        text = self.get_text()
-        self.emit('content-changed', text)
+    def flush_pending_changes(self):
+        """Emit a text change still waiting for the debounce delay"""
+        if self._text_changed_id is not None:
+            GLib.source_remove(self._text_changed_id)
+            self._flush_text_changed()
+
+    def get_word_count(self) -> int:
+        """Get current word count"""
+        return self._word_count
 
     def get_text(self) -> str:
         """Get current text content"""
@@ -819,15 +819,16 @@ class PreferencesDialog(Adw.PreferencesWindow):
             # Appearance
             self.dark_theme_row.set_active(self.config.get('use_dark_theme', False))
 
-            # Font
-            font_family = self.config.get('font_family', 'Liberation Serif')
-            model = self.font_family_row.get_model()
-            for i in range(model.get_n_items()):
-                if model.get_string(i) == font_family:
-                    self.font_family_row.set_selected(i)
-                    break
-
-            self.font_size_row.set_value(self.config.get('font_size', 12))
+            # Font (the rows only exist when the font group is built)
+            if hasattr(self, 'font_family_row'):
+                font_family = self.config.get('font_family', 'Liberation Serif')
+                model = self.font_family_row.get_model()
+                for i in range(model.get_n_items()):
+                    if model.get_string(i) == font_family:
+                        self.font_family_row.set_selected(i)
+                        break
+
+                self.font_size_row.set_value(self.config.get('font_size', 12))
 
             # Behavior
             self.auto_save_row.set_active(self.config.get('auto_save', True))
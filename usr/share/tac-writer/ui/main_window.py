@@ -18,7 +18,7 @@ from core.config import Config
 from core.ai_assistant import WritingAiAssistant
 from utils.helpers import FormatHelper
 from utils.i18n import _
-from .components import WelcomeView, ParagraphEditor, ProjectListWidget, SpellCheckHelper, PomodoroTimer, FirstRunTour
+from .components import WelcomeView, ParagraphEditor, ParagraphDropTarget, ProjectListWidget, SpellCheckHelper, PomodoroTimer, FirstRunTour
 from .dialogs import NewProjectDialog, ExportDialog, PreferencesDialog, AboutDialog, WelcomeDialog, BackupManagerDialog, ImageDialog
 
 
@@ -41,11 +41,12 @@ class MainWindow(Adw.ApplicationWindow):
         self.current_project: Project = None
 
         # Shared spell check helper
-        self.spell_helper = SpellCheckHelper(config) if config else None
+        self.spell_helper = SpellCheckHelper.get_shared(config) if config else None
 
         # Pomodoro Timer
         self.pomodoro_dialog = None
-        self.timer = PomodoroTimer()
+        self.timer = PomodoroTimer(state_file=self.config.data_dir / 'pomodoro.json')
+        self.timer.connect('timer-finished', self._on_pomodoro_finished)
 
         # AI assistant
         self.ai_assistant = WritingAiAssistant(self, self.config)
@@ -360,9 +361,18 @@ class MainWindow(Adw.ApplicationWindow):
         self.paragraphs_box.set_margin_top(20)
         self.paragraphs_box.set_margin_bottom(20)
 
+        # One drop target for all paragraphs instead of one per editor
+        self._paragraph_drop_target = ParagraphDropTarget(self.paragraphs_box)
+
         self.editor_scrolled.set_child(self.paragraphs_box)
         editor_box.append(self.editor_scrolled)
 
+        # Build deferred paragraph editors as they scroll into view
+        self._visible_build_id = None
+        adjustment = self.editor_scrolled.get_vadjustment()
+        adjustment.connect('value-changed', self._queue_visible_editor_build)
+        adjustment.connect('changed', self._queue_visible_editor_build)
+
         # Add existing paragraphs
         self._refresh_paragraphs()
 
@@ -500,6 +510,9 @@ class MainWindow(Adw.ApplicationWindow):
     def _process_next_paragraph(self):
         """Process next paragraph for asynchronous loading"""
         if not self._paragraphs_to_add:
+            # Short documents never move the scroll adjustment, so check
+            # which deferred editors are visible once everything is added
+            self._queue_visible_editor_build()
             return False
 
         paragraph = self._paragraphs_to_add.pop(0)
@@ -518,14 +531,44 @@ class MainWindow(Adw.ApplicationWindow):
                 widget = self._existing_widgets[paragraph.id]
                 self.paragraphs_box.append(widget)
             else:
-                paragraph_editor = ParagraphEditor(paragraph, config=self.config)
+                paragraph_editor = ParagraphEditor(paragraph, config=self.config, lazy=True)
                 paragraph_editor.connect('content-changed', self._on_paragraph_changed)
                 paragraph_editor.connect('remove-requested', self._on_paragraph_remove_requested)
                 paragraph_editor.connect('paragraph-reorder', self._on_paragraph_reorder)
+                paragraph_editor.connect('placeholder-shown', self._queue_visible_editor_build)
                 self.paragraphs_box.append(paragraph_editor)
                 self._existing_widgets[paragraph.id] = paragraph_editor
 
         return True
+
+    def _queue_visible_editor_build(self, *args):
+        """Coalesce scroll and layout changes into one visibility pass"""
+        if self._visible_build_id is None:
+            self._visible_build_id = GLib.idle_add(self._build_visible_editors)
+
+    def _build_visible_editors(self):
+        """Build deferred paragraph editors inside or near the viewport"""
+        self._visible_build_id = None
+
+        # Keep one page of slack above and below the visible area
+        adjustment = self.editor_scrolled.get_vadjustment()
+        page_size = adjustment.get_page_size()
+        top = adjustment.get_value() - page_size
+        bottom = adjustment.get_value() + 2 * page_size
+
+        child = self.paragraphs_box.get_first_child()
+        while child:
+            if hasattr(child, 'ensure_text_editor') and child.text_view is None:
+                # Editors not allocated yet are handled after the next layout
+                found, bounds = child.compute_bounds(self.paragraphs_box)
+                if found and child.get_height() > 0:
+                    if bounds.get_y() > bottom:
+                        break
+                    if bounds.get_y() + bounds.get_height() >= top:
+                        child.ensure_text_editor()
+            child = child.get_next_sibling()
+
+        return False
     
     def _create_image_widget(self, paragraph):
         """Create widget to display an image paragraph"""
@@ -833,7 +876,10 @@ class MainWindow(Adw.ApplicationWindow):
         """Handle paragraph removal request"""
         if self.current_project:
             self.current_project.remove_paragraph(paragraph_id)
-            self._refresh_paragraphs()
+            if paragraph_editor.get_parent() is self.paragraphs_box and not getattr(self, '_paragraphs_to_add', None):
+                self.paragraphs_box.remove(paragraph_editor)
+            else:
+                self._refresh_paragraphs()
             self._update_header_for_view("editor")
             # Update sidebar project list in real-time with current statistics
             current_stats = self.current_project.get_statistics()
@@ -859,12 +905,45 @@ class MainWindow(Adw.ApplicationWindow):
             new_position = target_position if current_position > target_position else target_position -1
         
         self.current_project.move_paragraph(dragged_id, new_position)
-        self._refresh_paragraphs()
+        if not self._move_paragraph_widget(dragged_id):
+            self._refresh_paragraphs()
         self._update_header_for_view("editor")
         self._show_toast(_("Paragraph reordered"))
 
+    def _move_paragraph_widget(self, paragraph_id) -> bool:
+        """Move a paragraph's existing widget to match the project order"""
+        # While paragraphs are still being added, a full refresh is needed
+        if getattr(self, '_paragraphs_to_add', None):
+            return False
+
+        widgets = {}
+        child = self.paragraphs_box.get_first_child()
+        while child:
+            if hasattr(child, 'paragraph'):
+                widgets[child.paragraph.id] = child
+            child = child.get_next_sibling()
+
+        widget = widgets.get(paragraph_id)
+        if widget is None:
+            return False
+
+        paragraphs = self.current_project.paragraphs
+        index = next(i for i, p in enumerate(paragraphs) if p.id == paragraph_id)
+        sibling = None
+        if index > 0:
+            sibling = widgets.get(paragraphs[index - 1].id)
+            if sibling is None:
+                return False
+
+        # Keeps the editor, its buffer and spell checker as they are
+        self.paragraphs_box.reorder_child_after(widget, sibling)
+        return True
+
     def _on_close_request(self, window):
         """Handle window close request"""
+        # Apply edits still waiting for the typing debounce
+        self._flush_paragraph_edits()
+
         # Cancel any pending auto-save timer
         if self.auto_save_timeout_id is not None:
             GLib.source_remove(self.auto_save_timeout_id)
@@ -888,6 +967,11 @@ class MainWindow(Adw.ApplicationWindow):
         """Handle window state changes"""
         self._save_window_state()
 
+    def _on_pomodoro_finished(self, timer, timer_type):
+        """Open the Pomodoro dialog when a resumed timer finishes before it was shown"""
+        if not self.pomodoro_dialog:
+            self._on_pomodoro_clicked(None)
+
     def _on_pomodoro_clicked(self, button):
         """Handle pomodoro button click"""
         if not self.pomodoro_dialog:
@@ -990,11 +1074,23 @@ class MainWindow(Adw.ApplicationWindow):
         file_chooser.connect('response', on_response)
         file_chooser.show()
 
+    def _flush_paragraph_edits(self):
+        """Apply text edits still pending in paragraph editors"""
+        if not hasattr(self, 'paragraphs_box'):
+            return
+
+        child = self.paragraphs_box.get_first_child()
+        while child:
+            if hasattr(child, 'flush_pending_changes'):
+                child.flush_pending_changes()
+            child = child.get_next_sibling()
+
     def save_current_project(self) -> bool:
         """Save the current project"""
         if not self.current_project:
             return False
 
+        self._flush_paragraph_edits()
         success = self.project_manager.save_project(self.current_project)
         if success:
             self._show_toast(_("Project saved successfully"))
@@ -1035,6 +1131,8 @@ class MainWindow(Adw.ApplicationWindow):
         # Only save if there's a current project
         if not self.current_project:
             return False  # Don't repeat timeout
+
+        self._flush_paragraph_edits()
         
         # Perform save (this will trigger backup creation)
         success = self.project_manager.save_project(self.current_project)
@@ -1058,6 +1156,7 @@ class MainWindow(Adw.ApplicationWindow):
             self._show_toast(_("No project to export"), Adw.ToastPriority.HIGH)
             return
 
+        self._flush_paragraph_edits()
         dialog = ExportDialog(self, self.current_project, self.export_service)
         dialog.present()
 
@@ -1594,6 +1693,9 @@ class MainWindow(Adw.ApplicationWindow):
             return views
         child = self.paragraphs_box.get_first_child()
         while child:
+            # Searching needs every buffer, including deferred ones
+            if hasattr(child, "ensure_text_editor"):
+                child.ensure_text_editor()
             text_view = getattr(child, "text_view", None)
             if text_view:
                 views.append(text_view)